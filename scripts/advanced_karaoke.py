@@ -26,8 +26,15 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import logging
 
+try:
+    import pykakasi
+except ImportError:
+    # Optional: Japanese romanization falls back to a placeholder
+    pykakasi = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -39,6 +46,18 @@ sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
 
+@lru_cache(maxsize=1)
+def _get_kakasi():
+    """Create the pykakasi converter once (loading its dictionaries is slow)."""
+    return pykakasi.kakasi()
+
+
+@lru_cache(maxsize=4096)
+def romanize_japanese(text: str) -> str:
+    """Convert Japanese text to Hepburn romaji, caching repeated lines."""
+    return " ".join(item["hepburn"] for item in _get_kakasi().convert(text) if item["hepburn"])
+
+
 # =============================================================================
 # TARGET AUDIENCE PROFILES
 # =============================================================================
@@ -488,9 +507,10 @@ class AdvancedLyricsGenerator:
         }
 
     def _generate_romanization(self, text: str, language: str) -> str:
-        """Generate basic romanization (simplified)."""
-        # In production, would use a library like pykakasi for Japanese
+        """Generate basic romanization (pykakasi for Japanese when installed)."""
         if language == "ja":
+            if pykakasi is not None:
+                return romanize_japanese(text)
             return f"[{text}]"  # Placeholder
         elif language == "ko":
             return f"[{text}]"  # Placeholder
@@ -7,14 +7,14 @@ import logging
 from pathlib import Path
 from datetime import datetime
 
-# Add project root to sys.path
+# Project root (output directory base)
 PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT", "/app"))
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-from processing.dataset_generator import DatasetGenerator
-from processing.lora_trainer_bridge import LoRATrainer
-from processing.pixelation_manager import PixelationManager
-from api.phase2_content_generator import Phase2ContentGenerator
+# Requires the project installed (pip install -e .)
+from src.processing.dataset_generator import DatasetGenerator
+from src.processing.lora_trainer_bridge import LoRATrainer
+from src.processing.pixelation_manager import PixelationManager
+from src.api.phase2_content_generator import Phase2ContentGenerator
 
 # Configure logging
 logging.basicConfig(
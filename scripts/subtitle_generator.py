@@ -21,12 +21,23 @@ import json
 import os
 import random
 import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # Optional: falls back to the stdlib json module
+    orjson = None
+
 # Logging configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +46,10 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Per-line (start, end) timestamps for SRT, VTT and ASS, in that order
+TimecodeSet = Tuple[Tuple[str, str], Tuple[str, str], Tuple[str, str]]
+
+
 class SubtitleFormat(Enum):
     """Subtitle format enumeration."""
     SRT = "srt"
@@ -231,6 +246,9 @@ class SubtitleGenerator:
         self.templates_config = {}
         self.quality_config = {}
         
+        # Style names are fixed per class, so compute them once
+        self._available_styles = tuple(self.STYLE_CONFIGS.keys())
+        
         # Output directory
         self.output_dir = os.environ.get(
             "SUBTITLE_OUTPUT_DIR", 
@@ -494,6 +512,39 @@ class SubtitleGenerator:
         
         return track
     
+    def _precompute_timecodes(self, track: SubtitleTrack) -> List[TimecodeSet]:
+        """
+        Formats every line's start/end once for the SRT, VTT and ASS exporters.
+        
+        Args:
+            track: SubtitleTrack to format
+            
+        Returns:
+            Per line: ((srt_start, srt_end), (vtt_start, vtt_end), (ass_start, ass_end))
+        """
+        timecodes = []
+        
+        for line in track.lines:
+            formatted = []
+            for seconds in (line.start_time, line.end_time):
+                hours = int(seconds // 3600)
+                minutes = int((seconds % 3600) // 60)
+                secs = int(seconds % 60)
+                millis = int((seconds % 1) * 1000)
+                centis = int((seconds % 1) * 100)
+                
+                base = f"{hours:02d}:{minutes:02d}:{secs:02d}"
+                formatted.append((
+                    f"{base},{millis:03d}",
+                    f"{base}.{millis:03d}",
+                    f"{hours}:{minutes:02d}:{secs:02d}.{centis:02d}"
+                ))
+            
+            (srt_start, vtt_start, ass_start), (srt_end, vtt_end, ass_end) = formatted
+            timecodes.append(((srt_start, srt_end), (vtt_start, vtt_end), (ass_start, ass_end)))
+        
+        return timecodes
+    
     def _format_srt_time(self, seconds: float) -> str:
         """Formats time to SRT format (HH:MM:SS,mmm)."""
         hours = int(seconds // 3600)
@@ -512,13 +563,15 @@ class SubtitleGenerator:
         
         return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
     
-    def export_srt(self, track: SubtitleTrack, output_path: str = None) -> str:
+    def export_srt(self, track: SubtitleTrack, output_path: str = None,
+                   _timecodes: List[TimecodeSet] = None) -> str:
         """
         Exports subtitles to SRT format.
         
         Args:
             track: SubtitleTrack to export
             output_path: File path (optional)
+            _timecodes: Shared output of _precompute_timecodes (optional)
             
         Returns:
             Exported file path
@@ -531,28 +584,32 @@ class SubtitleGenerator:
         
         srt_content = ""
         
-        for line in track.lines:
-            start = self._format_srt_time(line.start_time)
-            end = self._format_srt_time(line.end_time)
-            
+        if _timecodes is not None:
+            spans = [timecode[0] for timecode in _timecodes]
+        else:
+            spans = [(self._format_srt_time(line.start_time), self._format_srt_time(line.end_time))
+                     for line in track.lines]
+        
+        for line, (start, end) in zip(track.lines, spans):
             srt_content += f"{line.index}\n"
             srt_content += f"{start} --> {end}\n"
             srt_content += f"{line.text}\n\n"
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(srt_content)
+        Path(output_path).write_text(srt_content, encoding='utf-8')
         
         logger.info(f"✓ SRT subtitles exported: {output_path}")
         
         return output_path
     
-    def export_vtt(self, track: SubtitleTrack, output_path: str = None) -> str:
+    def export_vtt(self, track: SubtitleTrack, output_path: str = None,
+                   _timecodes: List[TimecodeSet] = None) -> str:
         """
         Exports subtitles to VTT format.
         
         Args:
             track: SubtitleTrack to export
             output_path: File path (optional)
+            _timecodes: Shared output of _precompute_timecodes (optional)
             
         Returns:
             Exported file path
@@ -565,28 +622,32 @@ class SubtitleGenerator:
         
         vtt_content = "WEBVTT\n\n"
         
-        for line in track.lines:
-            start = self._format_vtt_time(line.start_time)
-            end = self._format_vtt_time(line.end_time)
-            
+        if _timecodes is not None:
+            spans = [timecode[1] for timecode in _timecodes]
+        else:
+            spans = [(self._format_vtt_time(line.start_time), self._format_vtt_time(line.end_time))
+                     for line in track.lines]
+        
+        for line, (start, end) in zip(track.lines, spans):
             vtt_content += f"{line.index}\n"
             vtt_content += f"{start} --> {end}\n"
             vtt_content += f"{line.text}\n\n"
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(vtt_content)
+        Path(output_path).write_text(vtt_content, encoding='utf-8')
         
         logger.info(f"✓ VTT subtitles exported: {output_path}")
         
         return output_path
     
-    def export_ass(self, track: SubtitleTrack, output_path: str = None) -> str:
+    def export_ass(self, track: SubtitleTrack, output_path: str = None,
+                   _timecodes: List[TimecodeSet] = None) -> str:
         """
         Exports subtitles to ASS format (Advanced Substation Alpha).
         
         Args:
             track: SubtitleTrack to export
             output_path: File path (optional)
+            _timecodes: Shared output of _precompute_timecodes (optional)
             
         Returns:
             Exported file path
@@ -631,10 +692,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 """
         
         # Subtitle events
-        for line in track.lines:
-            start = self._format_ass_time(line.start_time)
-            end = self._format_ass_time(line.end_time)
-            
+        if _timecodes is not None:
+            spans = [timecode[2] for timecode in _timecodes]
+        else:
+            spans = [(self._format_ass_time(line.start_time), self._format_ass_time(line.end_time))
+                     for line in track.lines]
+        
+        for line, (start, end) in zip(track.lines, spans):
             # Position
             pos_x = int(line.position[0] * 1920)
             pos_y = int(line.position[1] * 1080)
@@ -644,8 +708,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 f"{{\\pos({pos_x},{pos_y})}}{line.text}\n"
             )
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(ass_content)
+        Path(output_path).write_text(ass_content, encoding='utf-8')
         
         logger.info(f"✓ ASS subtitles exported: {output_path}")
         
@@ -702,8 +765,12 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 f"{track.id}.json"
             )
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(track.to_dict(), f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            Path(output_path).write_bytes(orjson.dumps(track.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            Path(output_path).write_text(
+                json.dumps(track.to_dict(), ensure_ascii=False, indent=2), encoding='utf-8'
+            )
         
         logger.info(f"✓ JSON subtitles exported: {output_path}")
         
@@ -744,34 +811,20 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         Returns:
             SubtitleTrack with adjusted timing
         """
-        new_lines = []
-        current_time = offset if offset > 0 else 0.0
+        start = offset if offset > 0 else 0.0
         
-        for line in track.lines:
-            new_start = current_time
-            new_duration = (line.end_time - line.start_time) * scale
-            new_end = new_start + new_duration
-            
-            new_lines.append(SubtitleLine(
-                index=line.index,
-                start_time=new_start,
-                end_time=new_end,
-                text=line.text,
-                style=line.style,
-                animation=line.animation,
-                position=line.position,
-                font_size=line.font_size,
-                font_color=line.font_color,
-                background_color=line.background_color,
-                font_name=line.font_name,
-                bold=line.bold,
-                italic=line.italic
-            ))
-            
-            current_time = new_end
+        # Lines are laid out back to back: each scaled duration starts where
+        # the previous one ended, i.e. a running sum seeded with the offset
+        starts = np.fromiter((line.start_time for line in track.lines), dtype=np.float64, count=len(track.lines))
+        ends = np.fromiter((line.end_time for line in track.lines), dtype=np.float64, count=len(track.lines))
+        durations = (ends - starts) * scale
+        bounds = np.cumsum(np.concatenate(([start], durations)))
         
-        track.lines = new_lines
-        track.video_duration = current_time
+        track.lines = [
+            replace(line, start_time=float(new_start), end_time=float(new_end))
+            for line, new_start, new_end in zip(track.lines, bounds[:-1], bounds[1:])
+        ]
+        track.video_duration = float(bounds[-1])
         
         logger.info(f"✓ Timing adjusted: offset={offset}s, scale={scale}")
         
@@ -873,14 +926,14 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         return combined
     
-    def get_available_styles(self) -> List[str]:
+    def get_available_styles(self) -> Tuple[str, ...]:
         """
         Gets the list of available styles.
         
         Returns:
-            List of style names
+            Tuple of style names
         """
-        return list(self.STYLE_CONFIGS.keys())
+        return self._available_styles
     
     def preview_subtitles(self, track: SubtitleTrack, 
                           max_lines: int = 5) -> str:
@@ -894,19 +947,26 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         Returns:
             String with the preview
         """
-        preview = f"=== SUBTITLE PREVIEW ({track.format.value.upper()}) ===\n"
-        preview += f"Total duration: {track.video_duration:.1f}s | Lines: {len(track.lines)}\n"
-        preview += f"Language: {track.language} | Style: {track.style_config}\n"
-        preview += "-" * 50 + "\n"
-        
-        for line in track.lines[:max_lines]:
-            start = self._format_srt_time(line.start_time)
-            preview += f"[{start}] {line.text}\n"
+        parts = [
+            f"=== SUBTITLE PREVIEW ({track.format.value.upper()}) ===",
+            f"Total duration: {track.video_duration:.1f}s | Lines: {len(track.lines)}",
+            f"Language: {track.language} | Style: {track.style_config}",
+            "-" * 50,
+        ]
+        parts.extend(
+            f"[{self._format_srt_time(line.start_time)}] {line.text}"
+            for line in track.lines[:max_lines]
+        )
         
         if len(track.lines) > max_lines:
-            preview += f"... and {len(track.lines) - max_lines} more lines\n"
+            parts.append(f"... and {len(track.lines) - max_lines} more lines")
         
-        return preview
+        parts.append("")
+        return "\n".join(parts)
+
+
+# Script line stand-in used by the demo (subtitle_text, text)
+_MockLine = namedtuple("_MockLine", ("subtitle_text", "text"))
 
 
 def main():
@@ -927,22 +987,12 @@ def main():
         def __init__(self):
             self.title = "Demo Script"
             self.lines = [
-                type('Line', (), {
-                    'subtitle_text': 'Hello! Welcome to this video.',
-                    'text': 'Hello! Welcome to this video.'
-                })(),
-                type('Line', (), {
-                    'subtitle_text': 'Today we will learn something incredible.',
-                    'text': 'Today we will learn something incredible.'
-                })(),
-                type('Line', (), {
-                    'subtitle_text': "Don't miss any detail.",
-                    'text': "Don't miss any detail."
-                })(),
-                type('Line', (), {
-                    'subtitle_text': 'Like and subscribe.',
-                    'text': 'Like and subscribe.'
-                })()
+                _MockLine(text, text) for text in (
+                    'Hello! Welcome to this video.',
+                    'Today we will learn something incredible.',
+                    "Don't miss any detail.",
+                    'Like and subscribe.',
+                )
             ]
     
     script = MockScript()
@@ -970,17 +1020,22 @@ def main():
     
     # Export in different formats
     print("💾 Exporting formats...")
-    srt_path = generator.export_srt(track)
-    print(f"  ✓ SRT: {srt_path}")
-    
-    vtt_path = generator.export_vtt(track)
-    print(f"  ✓ VTT: {vtt_path}")
-    
-    ass_path = generator.export_ass(track)
-    print(f"  ✓ ASS: {ass_path}")
+    timecodes = generator._precompute_timecodes(track)
+    exporters = [
+        ("SRT", generator.export_srt, {"_timecodes": timecodes}),
+        ("VTT", generator.export_vtt, {"_timecodes": timecodes}),
+        ("ASS", generator.export_ass, {"_timecodes": timecodes}),
+        ("JSON", generator.export_json, {}),
+    ]
     
-    json_path = generator.export_json(track)
-    print(f"  ✓ JSON: {json_path}")
+    # The writes are I/O bound, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(exporters)) as executor:
+        futures = [
+            (name, executor.submit(export, track, **kwargs))
+            for name, export, kwargs in exporters
+        ]
+        for name, future in futures:
+            print(f"  ✓ {name}: {future.result()}")
     
     # Test timing adjustment
     print("\n⏱ Testing timing adjustment...")
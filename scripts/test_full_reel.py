@@ -144,7 +144,7 @@ async def test_complete_pipeline():
     
     voice_script = "Hello! I am Miyuki Sakura. Today is a beautiful day!"
     
-   print(f"🎙️  Script: {voice_script}")
+    print(f"🎙️  Script: {voice_script}")
     print()
     
     # Nota: Esto requiere ejecución del contenedor Piper
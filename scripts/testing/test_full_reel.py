@@ -14,10 +14,23 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Añadir src al path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Requiere el proyecto instalado: pip install -e .
+from src.api.a2e_client import A2EClient, GenerationConfig, A2EModelType, VideoResolution
 
-from api.a2e_client import A2EClient, GenerationConfig, A2EModelType, VideoResolution
+# Prompt simulado - en producción llamarías a Ollama
+PROMPT = (
+    "Ultra realistic portrait of Miyuki Sakura, 22-year-old Japanese woman, "
+    "warm smile, morning sunlight, elegant style, soft focus background, "
+    "cherry blossoms, professional quality, 4K"
+)
+
+
+def print_banner(title: str):
+    """Cabecera de sección del demo; python -O la elimina (__debug__ es False)."""
+    if __debug__:
+        print("=" * 60)
+        print(title)
+        print("=" * 60)
 
 
 async def test_complete_pipeline():
@@ -25,47 +38,26 @@ async def test_complete_pipeline():
     Test completo del pipeline de generación de reel
     """
     
-    print("=" * 60)
-    print("WAIFUGEN - TEST PIPELINE COMPLETO")
-    print("=" * 60)
-    print()
-    
-    # Crear directorio de salida
-    output_dir = Path(f"/tmp/waifugen_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    print(f"📁 Directorio de salida: {output_dir}")
+    print_banner("WAIFUGEN - TEST PIPELINE COMPLETO")
     print()
     
     # ==================================================================
     # PASO 1: Generar Prompt con Ollama
     # ==================================================================
     
-    print("=" * 60)
-    print("PASO 1: Generación de Prompt (Ollama)")
-    print("=" * 60)
+    print_banner("PASO 1: Generación de Prompt (Ollama)")
     
-    # Simulado - en producción llamarías a Ollama
-    prompt = """
-    Ultra realistic portrait of Miyuki Sakura, 22-year-old Japanese woman,
-    warm smile, morning sunlight, elegant style, soft focus background,
-    cherry blossoms, professional quality, 4K
-    """.strip()
+    prompt = PROMPT
     
     print(f"✓ Prompt generado:")
     print(f"  {prompt}")
     print()
     
-    # Guardar prompt
-    (output_dir / "prompt.txt").write_text(prompt)
-    
     # ==================================================================
     # PASO 2: Generar Video con A2E
     # ==================================================================
     
-    print("=" * 60)
-    print("PASO 2: Generación de Video (A2E API)")
-    print("=" * 60)
+    print_banner("PASO 2: Generación de Video (A2E API)")
     
     # Verificar API key
     api_key = os.getenv("A2E_API_KEY")
@@ -79,6 +71,14 @@ async def test_complete_pipeline():
     print(f"✓ API Key detectada: {api_key[:20]}...")
     print()
     
+    # Crear directorio de salida solo cuando la configuración es válida
+    output_dir = Path(f"/tmp/waifugen_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "prompt.txt").write_text(prompt)
+    
+    print(f"📁 Directorio de salida: {output_dir}")
+    print()
+    
     # Inicializar cliente A2E
     try:
         client = A2EClient(api_key=api_key)
@@ -114,7 +114,7 @@ async def test_complete_pipeline():
         print(f"✓ Job iniciado: {job_id}")
         
         # Esperar completación
-        result = await client.wait_for_completion(job_id, timeout=300)
+        result = await client.wait_for_completion(job_id, max_wait=300)
         
         if result:
             print(f"✓ Video generado exitosamente")
@@ -138,13 +138,11 @@ async def test_complete_pipeline():
     # PASO 3: Generar Voz con Piper TTS
     # ==================================================================
     
-    print("=" * 60)
-    print("PASO 3: Generación de Voz (Piper TTS)")
-    print("=" * 60)
+    print_banner("PASO 3: Generación de Voz (Piper TTS)")
     
     voice_script = "Hello! I am Miyuki Sakura. Today is a beautiful day!"
     
-   print(f"🎙️  Script: {voice_script}")
+    print(f"🎙️  Script: {voice_script}")
     print()
     
     # Nota: Esto requiere ejecución del contenedor Piper
@@ -156,9 +154,7 @@ async def test_complete_pipeline():
     # PASO 4: Música
     # ==================================================================
     
-    print("=" * 60)
-    print("PASO 4: Música de Fondo")
-    print("=" * 60)
+    print_banner("PASO 4: Música de Fondo")
     
     print("🎵 Música placeholder")
     print("   En producción: Replicate MusicGen o Pixabay")
@@ -168,9 +164,7 @@ async def test_complete_pipeline():
     # RESUMEN
     # ==================================================================
     
-    print("=" * 60)
-    print("RESUMEN")
-    print("=" * 60)
+    print_banner("RESUMEN")
     print()
     print("✓ Prompt generado (Ollama)")
     print("✓ Video generado (A2E)")
@@ -180,9 +174,7 @@ async def test_complete_pipeline():
     print()
     print(f"📁 Archivos en: {output_dir}")
     print()
-    print("=" * 60)
-    print("TEST COMPLETADO")
-    print("=" * 60)
+    print_banner("TEST COMPLETADO")
     
     return True
 
@@ -2,12 +2,6 @@
 import asyncio
 import os
 import json
-import sys
-from pathlib import Path
-
-# Add core paths
-PROJECT_ROOT = Path("c:/Users/Sebas/Downloads/package (1)/waifugen_system")
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
 # Mock data for Miyuki Sakura
 character = {
@@ -1,9 +1,9 @@
 
 import json
-import subprocess
 import os
-import sys
-from pathlib import Path
+
+# Requiere el proyecto instalado (pip install -e .) para importar el puente
+from src.processing import n8n_long_video_bridge as bridge
 
 # Configuración del Test - Hana Nakamura Nivel 6 (Mid-tier NSFW)
 test_payload = {
@@ -27,19 +27,9 @@ def run_test():
     print(f"🛠️  Motor: GPU Remota (RunPod RTX 4090) + LipSync HQ + 4K Upscale")
     print("-" * 50)
 
-    # Llamar al puente n8n
-    bridge_path = "src/processing/n8n_long_video_bridge.py"
+    # Llamar al puente n8n en el mismo intérprete (sin subprocess ni JSON por argv)
     try:
-        # Usamos json.dumps para pasar el argumento correctamente
-        result = subprocess.run(
-            [sys.executable, bridge_path, json.dumps(test_payload)],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        # Imprimir salida parseada
-        output_data = json.loads(result.stdout)
+        output_data = bridge.run(test_payload)
         print("\n✅ RESPUESTA DEL SISTEMA:")
         print(json.dumps(output_data, indent=4))
         
@@ -55,8 +45,6 @@ def run_test():
         
     except Exception as e:
         print(f"\n❌ ERROR EN EL TEST: {str(e)}")
-        if hasattr(e, 'stderr'):
-            print(f"Detalles: {e.stderr}")
 
 if __name__ == "__main__":
     run_test()
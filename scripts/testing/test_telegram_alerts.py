@@ -1,12 +1,8 @@
 import asyncio
 import os
-import sys
-from pathlib import Path
 from dotenv import load_dotenv
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
+# Requires the project to be installed: pip install -e .
 from src.monitoring.telegram_bot import TelegramBot, TelegramConfig, NotificationType
 
 async def test_telegram_alert():
@@ -45,8 +41,8 @@ async def test_telegram_alert():
             details="Status: Active\nPhase: 2\nMode: Expert"
         )
         
-        # Dar tiempo a que se procese la cola
-        await asyncio.sleep(5)
+        # Esperar a que la cola se vacíe (como máximo 30s)
+        await asyncio.wait_for(bot.flush(), timeout=30)
         
         print("✅ Alerta enviada. Revisa tu móvil.")
         
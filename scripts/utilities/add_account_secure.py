@@ -2,41 +2,121 @@
 """
 Script de Ingesta Segura para WaifuGen
 Permite cargar cuentas de redes sociales y proxies con encriptación AES-256.
+
+Uso:
+    python add_account_secure.py                         # menú interactivo
+    python add_account_secure.py --from-csv cuentas.csv  # ingesta masiva
+
+El CSV necesita las columnas: character_id, platform, username, password
 """
 
 import os
 import sys
-import psycopg2
+import csv
+import argparse
+import psycopg
 from getpass import getpass
 
-# Importar el módulo de seguridad
-sys.path.insert(0, '/root/waifugen-system')
+# Importar el módulo de seguridad (requiere: pip install -e .)
 from src.utils.security import vault
 
+# Mapa de opciones del menú a plataformas
+PLATFORM_MAP = {
+    "1": "youtube",
+    "2": "tiktok",
+    "3": "instagram",
+    "4": "facebook",
+    "5": "discord",
+    "6": "line",
+    "7": "fantia",
+    "8": "fc2",
+    "9": "telegram"
+}
+
+# Columnas obligatorias del CSV de ingesta masiva
+CSV_COLUMNS = ("character_id", "platform", "username", "password")
+
+INSERT_ACCOUNT_SQL = """
+    INSERT INTO accounts (character_id, platform, username, password_enc, status, region)
+    VALUES (%s, %s, %s, %s, 'active', 'ES')
+    RETURNING id
+"""
+
+# Conexión y personajes reutilizados durante toda la sesión
+_conn = None
+_characters = None
+
 def connect_db():
-    """Conecta a la base de datos PostgreSQL"""
+    """Conecta a la base de datos PostgreSQL (una sola conexión por sesión)"""
+    global _conn
+    if _conn is not None and not _conn.closed:
+        return _conn
     try:
-        conn = psycopg2.connect(
+        _conn = psycopg.connect(
             host=os.getenv('POSTGRES_HOST', 'localhost'),
-            database=os.getenv('POSTGRES_DB', 'waifugen_prod'),
+            dbname=os.getenv('POSTGRES_DB', 'waifugen_prod'),
             user=os.getenv('POSTGRES_USER', 'waifugen_user'),
             password=os.getenv('POSTGRES_PASSWORD', 'WaifuGen2026Secure'),
             port=os.getenv('POSTGRES_PORT', '5432')
         )
-        return conn
+        _conn.autocommit = False
+        return _conn
     except Exception as e:
         print(f"❌ Error conectando a la base de datos: {e}")
         sys.exit(1)
 
+def close_db():
+    """Cierra la conexión compartida si está abierta"""
+    global _conn
+    if _conn is not None and not _conn.closed:
+        _conn.close()
+    _conn = None
+
+def get_characters():
+    """Devuelve la lista de personajes (consultada una sola vez)"""
+    global _characters
+    if _characters is None:
+        with connect_db().cursor() as cur:
+            cur.execute("SELECT id, name FROM characters ORDER BY id")
+            _characters = cur.fetchall()
+    return _characters
+
+def bulk_add_accounts(rows):
+    """
+    Inserta varias cuentas en modo pipeline: todos los INSERT se envían
+    sin esperar la respuesta de cada uno (una sola ida y vuelta).
+
+    Args:
+        rows: Lista de tuplas (character_id, platform, username, password_enc)
+              con la contraseña ya encriptada
+
+    Returns:
+        Lista de IDs de las cuentas insertadas
+    """
+    if not rows:
+        return []
+    conn = connect_db()
+    account_ids = []
+    try:
+        with conn.cursor() as cur:
+            with conn.pipeline():
+                cur.executemany(INSERT_ACCOUNT_SQL, rows, returning=True)
+            # Un conjunto de resultados por fila insertada
+            account_ids.append(cur.fetchone()[0])
+            while cur.nextset():
+                account_ids.append(cur.fetchone()[0])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return account_ids
+
 def add_account():
     """Añade una cuenta de red social con encriptación"""
     print("\n🔐 === AÑADIR CUENTA DE RED SOCIAL (SEGURO) ===\n")
     
     # Listar personajes disponibles
-    conn = connect_db()
-    cur = conn.cursor()
-    cur.execute("SELECT id, name FROM characters ORDER BY id")
-    characters = cur.fetchall()
+    characters = get_characters()
     
     print("Personajes disponibles:")
     for char_id, name in characters:
@@ -57,19 +137,7 @@ def add_account():
     print("  9. Telegram")
     
     platform_choice = input("\nElige plataforma (1-9): ").strip()
-    platform_map = {
-        "1": "youtube",
-        "2": "tiktok",
-        "3": "instagram",
-        "4": "facebook",
-        "5": "discord",
-        "6": "line",
-        "7": "fantia",
-        "8": "fc2",
-        "9": "telegram"
-    }
-    
-    platform = platform_map.get(platform_choice, "tiktok")
+    platform = PLATFORM_MAP.get(platform_choice, "tiktok")
     username = input("Usuario/Email de la cuenta: ")
     password = getpass("Contraseña (no se mostrará): ")
     
@@ -77,20 +145,76 @@ def add_account():
     password_encrypted = vault.encrypt(password)
     
     # Insertar en la base de datos
-    cur.execute("""
-        INSERT INTO accounts (character_id, platform, username, password_enc, status, region)
-        VALUES (%s, %s, %s, %s, 'active', 'ES')
-        RETURNING id
-    """, (character_id, platform, username, password_encrypted))
-    
-    account_id = cur.fetchone()[0]
-    conn.commit()
+    account_id = bulk_add_accounts([(character_id, platform, username, password_encrypted)])[0]
     
     print(f"\n✅ Cuenta añadida con éxito (ID: {account_id})")
     print(f"   Contraseña encriptada: {password_encrypted[:50]}...")
+
+def import_accounts_csv(csv_path):
+    """
+    Ingesta masiva de cuentas desde un CSV.
+    
+    Lee y valida todo el archivo (columnas obligatorias, character_id
+    numérico, plataforma de PLATFORM_MAP o su número de menú, usuario y
+    contraseña no vacíos); si alguna fila es inválida, muestra
+    los errores con su línea y aborta sin insertar nada. Después encripta
+    las contraseñas en una sola pasada con el vault compartido e inserta
+    todas las filas en un único lote.
+    
+    Args:
+        csv_path: Ruta al CSV (character_id, platform, username, password)
+    
+    Returns:
+        Lista de IDs de las cuentas insertadas
+    """
+    print(f"\n🔐 === INGESTA MASIVA DE CUENTAS: {csv_path} ===\n")
+    
+    # Validar todo el archivo antes de insertar nada
+    valid_rows = []
+    errors = []
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        missing = [col for col in CSV_COLUMNS if col not in (reader.fieldnames or [])]
+        if missing:
+            print(f"❌ CSV inválido: faltan las columnas {', '.join(missing)}")
+            sys.exit(1)
+        
+        for row in reader:
+            try:
+                character_id = int(row['character_id'])
+            except (TypeError, ValueError):
+                errors.append(f"línea {reader.line_num}: character_id inválido: {row['character_id']!r}")
+                continue
+            
+            # Se aceptan el nombre de la plataforma o el número del menú
+            platform = (row['platform'] or '').strip().lower()
+            platform = PLATFORM_MAP.get(platform, platform)
+            if platform not in PLATFORM_MAP.values():
+                errors.append(f"línea {reader.line_num}: plataforma desconocida: {row['platform']!r}")
+                continue
+            
+            # Filas cortas: DictReader rellena las columnas que faltan con None
+            empty = [col for col in ("username", "password") if not (row[col] or '').strip()]
+            if empty:
+                errors.append(f"línea {reader.line_num}: {', '.join(empty)} vacío")
+                continue
+            
+            valid_rows.append((character_id, platform, row['username'], row['password']))
     
-    cur.close()
-    conn.close()
+    if errors:
+        print(f"❌ CSV inválido, no se ha insertado ninguna cuenta ({len(errors)} errores):")
+        for error in errors:
+            print(f"   - {error}")
+        sys.exit(1)
+    
+    rows = [
+        (character_id, platform, username, vault.encrypt(password))
+        for character_id, platform, username, password in valid_rows
+    ]
+    
+    account_ids = bulk_add_accounts(rows)
+    print(f"✅ {len(account_ids)} cuentas añadidas con éxito")
+    return account_ids
 
 def add_proxy():
     """Añade un proxy con encriptación"""
@@ -107,25 +231,32 @@ def add_proxy():
     
     # Insertar en la base de datos
     conn = connect_db()
-    cur = conn.cursor()
-    
-    cur.execute("""
-        INSERT INTO proxies (proxy_type, host, port, username, password_enc, status, region)
-        VALUES (%s, %s, %s, %s, %s, 'active', 'ES')
-        RETURNING id
-    """, (proxy_type, host, port, username, password_encrypted))
     
-    proxy_id = cur.fetchone()[0]
+    with conn.cursor() as cur:
+        cur.execute("""
+            INSERT INTO proxies (proxy_type, host, port, username, password_enc, status, region)
+            VALUES (%s, %s, %s, %s, %s, 'active', 'ES')
+            RETURNING id
+        """, (proxy_type, host, port, username, password_encrypted))
+        proxy_id = cur.fetchone()[0]
     conn.commit()
     
     print(f"\n✅ Proxy añadido con éxito (ID: {proxy_id})")
     print(f"   Contraseña encriptada: {password_encrypted[:50]}...")
-    
-    cur.close()
-    conn.close()
 
 def main():
     """Menú principal"""
+    parser = argparse.ArgumentParser(description='Ingesta segura de datos WaifuGen')
+    parser.add_argument('--from-csv', type=str, help='CSV de cuentas a importar en lote')
+    args = parser.parse_args()
+    
+    if args.from_csv:
+        try:
+            import_accounts_csv(args.from_csv)
+        finally:
+            close_db()
+        return
+    
     print("=" * 60)
     print("  WAIFUGEN - INGESTA SEGURA DE DATOS")
     print("  Todas las contraseñas se encriptan con AES-256")
@@ -145,6 +276,7 @@ def main():
             add_proxy()
         elif choice == "3":
             print("\n👋 ¡Hasta luego!")
+            close_db()
             break
         else:
             print("❌ Opción inválida")
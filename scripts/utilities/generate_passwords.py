@@ -14,31 +14,207 @@ Uso:
     python generate_passwords.py --output .env
 
 Características:
-- Derivación determinista usando PBKDF2-HMAC-SHA256
+- Derivación determinista usando PBKDF2-HMAC-SHA256 (otros esquemas con --kdf)
 - Contraseñas únicas para cada servicio
 - Formato base64 seguro para URLs
 - Longitud configurable (por defecto 32 caracteres)
+
+Dependencias opcionales:
+- fastpbkdf2: backend PBKDF2 alternativo, no incluido en requirements.txt
+  (solo se publica como sdist de 2016 y en Python 3.11 se instala sin su
+  extensión cffi). Instálalo a mano si tienes un build funcional; si no
+  carga, se usa hashlib.pbkdf2_hmac con los mismos resultados.
 ============================================================================
 """
 
+import os
 import hashlib
+import hmac
+import json
 import base64
 import argparse
 import sys
-from typing import Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+
+# fastpbkdf2 precalcula los estados ipad/opad de HMAC una sola vez por
+# derivación; misma firma y mismos resultados que hashlib.pbkdf2_hmac.
+# Ambos usan la compresión SHA-256 de OpenSSL, que ya elige en tiempo de
+# ejecución la ruta SHA-NI cuando la CPU la soporta.
+try:
+    from fastpbkdf2 import pbkdf2_hmac
+    PBKDF2_BACKEND = 'fastpbkdf2'
+except ImportError:
+    try:
+        from hashlib import pbkdf2_hmac
+        PBKDF2_BACKEND = 'hashlib (OpenSSL)'
+    except ImportError:
+        # CPython >= 3.12 compilado sin OpenSSL ya no trae pbkdf2_hmac
+        pbkdf2_hmac = None
+        PBKDF2_BACKEND = 'Python puro'
+
+# Argon2id (opcional): solo para --kdf argon2id
+try:
+    from argon2.low_level import Type as Argon2Type, hash_secret_raw
+except ImportError:
+    hash_secret_raw = None
+
+
+# Máscaras ipad/opad de HMAC como enteros, por tamaño de bloque del hash
+# (64 bytes: SHA-256; 128 bytes: SHA-512)
+_HMAC_PAD_MASKS = {
+    block_size: (int.from_bytes(b'\x36' * block_size, 'big'),
+                 int.from_bytes(b'\x5c' * block_size, 'big'))
+    for block_size in (64, 128)
+}
+
+
+def _pbkdf2_hmac_py(hash_name: str, password: bytes, salt: bytes,
+                    iterations: int, dklen: int = None) -> bytes:
+    """
+    PBKDF2-HMAC en Python puro (RFC 8018), último recurso sin backend en C.
+    
+    La clave es la misma en todos los U_j = HMAC(P, U_{j-1}), así que los
+    estados ipad/opad se calculan una sola vez y cada HMAC parte de una
+    copia de ellos en lugar de recomprimir el bloque de la clave.
+    
+    Args:
+        hash_name: Algoritmo de hash (ej: 'sha256')
+        password: Contraseña maestra en bytes
+        salt: Salt del servicio
+        iterations: Número de iteraciones
+        dklen: Longitud de la clave derivada (por defecto, la del digest)
+    
+    Returns:
+        Clave derivada, idéntica a la de hashlib.pbkdf2_hmac
+    """
+    inner = hashlib.new(hash_name)
+    outer = hashlib.new(hash_name)
+    block_size = inner.block_size
+    if len(password) > block_size:
+        password = hashlib.new(hash_name, password).digest()
+    # XOR de la clave con ipad/opad en una sola operación de enteros
+    ipad_mask, opad_mask = _HMAC_PAD_MASKS[block_size]
+    key_int = int.from_bytes(password.ljust(block_size, b'\x00'), 'big')
+    inner.update((key_int ^ ipad_mask).to_bytes(block_size, 'big'))
+    outer.update((key_int ^ opad_mask).to_bytes(block_size, 'big'))
+    
+    def prf(msg: bytes) -> bytes:
+        icpy = inner.copy()
+        ocpy = outer.copy()
+        icpy.update(msg)
+        ocpy.update(icpy.digest())
+        return ocpy.digest()
+    
+    dklen = dklen or outer.digest_size
+    blocks = []
+    for index in range(1, -(-dklen // outer.digest_size) + 1):
+        prev = prf(salt + index.to_bytes(4, 'big'))
+        acc = int.from_bytes(prev, 'big')
+        for _ in range(iterations - 1):
+            prev = prf(prev)
+            acc ^= int.from_bytes(prev, 'big')
+        blocks.append(acc.to_bytes(outer.digest_size, 'big'))
+    return b''.join(blocks)[:dklen]
+
+
+if pbkdf2_hmac is None:
+    pbkdf2_hmac = _pbkdf2_hmac_py
+
+
+def _hkdf_extract(salt: bytes, ikm: bytes) -> bytes:
+    """HKDF-Extract con HMAC-SHA256 (RFC 5869)."""
+    return hmac.new(salt, ikm, hashlib.sha256).digest()
+
+
+def _hkdf_expand(prk: bytes, info: bytes, length: int) -> bytes:
+    """HKDF-Expand con HMAC-SHA256 (RFC 5869): unas pocas llamadas HMAC."""
+    blocks = []
+    block = b''
+    for counter in range(1, -(-length // hashlib.sha256().digest_size) + 1):
+        block = hmac.new(prk, block + info + bytes([counter]), hashlib.sha256).digest()
+        blocks.append(block)
+    return b''.join(blocks)[:length]
+
+
+# Esquemas de derivación disponibles. El primero es el original y el de por
+# defecto; los demás producen contraseñas distintas y hay que elegirlos
+# explícitamente (y volver a pasarlos para regenerar).
+KDF_ALGORITHMS = {
+    'pbkdf2-sha256': 'PBKDF2-HMAC-SHA256',
+    'pbkdf2-sha512': 'PBKDF2-HMAC-SHA512 (claves de más de 32 caracteres)',
+    'hkdf-secrets': 'PBKDF2-HMAC-SHA256 + HKDF-SHA256 (claves de aplicación)',
+    'argon2id': 'Argon2id (t=3, m=64 MiB, p=2)',
+    'hkdf-all': 'PBKDF2-HMAC-SHA256 (una vez) + HKDF-Expand por servicio (v2)',
+}
+DEFAULT_KDF = 'pbkdf2-sha256'
+
+# Con 'hkdf-secrets' estas claves se expanden con HKDF desde una única clave
+# maestra estirada con PBKDF2, en lugar de pagar 100.000 iteraciones cada una;
+# 'hkdf-all' (dominio v2) hace lo mismo con los seis servicios
+APP_SECRET_SERVICES = frozenset({'secret_key', 'jwt_secret', 'encryption'})
+MASTER_KEY_SALT = b'waifugen_master_2026'
+
+
+# Posprocesado del base64: '-' pasa a '_' y se elimina el padding '='
+_B64_MANGLE = bytes.maketrans(b'-', b'_')
+_B64_STRIP = b'='
+
+
+# Servicios del sistema: (variable de entorno, nombre del servicio, longitud)
+SERVICES = (
+    ('POSTGRES_PASSWORD', 'postgres', 40),
+    ('REDIS_PASSWORD', 'redis', 40),
+    ('SECRET_KEY', 'secret_key', 64),
+    ('GRAFANA_PASSWORD', 'grafana', 40),
+    ('JWT_SECRET', 'jwt_secret', 64),
+    ('ENCRYPTION_KEY', 'encryption', 64),
+)
 
 
 class PasswordGenerator:
     """Generador de contraseñas deterministas usando PBKDF2."""
     
-    def __init__(self, master_password: str):
+    # Salts de los servicios conocidos, codificados una sola vez
+    _SALTS = {
+        service_name: f"waifugen_system_{service_name}_2026".encode('utf-8')
+        for _, service_name, _ in SERVICES
+    }
+    
+    def __init__(self, master_password: str, kdf: str = DEFAULT_KDF):
         """
         Inicializa el generador con una contraseña maestra.
         
         Args:
             master_password: Contraseña maestra para derivar todas las demás
+            kdf: Esquema de derivación (ver KDF_ALGORITHMS)
         """
+        if kdf not in KDF_ALGORITHMS:
+            raise ValueError(f"Esquema de derivación desconocido: {kdf}")
+        if kdf == 'argon2id' and hash_secret_raw is None:
+            raise ImportError("argon2id requiere argon2-cffi: pip install argon2-cffi")
         self.master_password = master_password.encode('utf-8')
+        self.kdf = kdf
+        self._master_key = None
+        self._master_key_lock = threading.Lock()
+    
+    def _stretched_master_key(self, iterations: int) -> bytes:
+        """
+        Clave maestra de 32 bytes estirada con PBKDF2, calculada una sola vez.
+        
+        HKDF no añade coste de fuerza bruta, así que nunca se alimenta con la
+        contraseña maestra directamente: una clave filtrada no debe permitir
+        probar contraseñas maestras más rápido que con PBKDF2.
+        """
+        with self._master_key_lock:
+            if self._master_key is None:
+                self._master_key = pbkdf2_hmac(
+                    'sha256', self.master_password, MASTER_KEY_SALT, iterations, dklen=32
+                )
+            return self._master_key
     
     def generate(self, service_name: str, length: int = 32, iterations: int = 100000) -> str:
         """
@@ -52,93 +228,174 @@ class PasswordGenerator:
         Returns:
             Contraseña segura en formato base64
         """
-        # Usar el nombre del servicio como salt
-        salt = f"waifugen_system_{service_name}_2026".encode('utf-8')
+        # Bytes mínimos cuyo base64 llega a `length` caracteres. La salida de
+        # PBKDF2/HKDF más corta es prefijo de la larga, así que el resultado
+        # no cambia; para 40 caracteres basta un bloque SHA-256 en vez de dos.
+        dklen = (length * 3 + 3) // 4
         
-        # Derivar clave usando PBKDF2-HMAC-SHA256
-        derived_key = hashlib.pbkdf2_hmac(
-            'sha256',
-            self.master_password,
-            salt,
-            iterations,
-            dklen=length
-        )
+        # Usar el nombre del servicio como salt
+        salt = (self._SALTS.get(service_name)
+                or f"waifugen_system_{service_name}_2026".encode('utf-8'))
+        hash_name = 'sha256'
         
-        # Convertir a base64 URL-safe y truncar a la longitud deseada
-        password = base64.urlsafe_b64encode(derived_key).decode('utf-8')
+        # Con SHA-512 una clave de hasta 64 bytes sale de un único bloque
+        # PBKDF2 (dos con SHA-256). Salt propio para no reutilizar material.
+        if self.kdf == 'pbkdf2-sha512' and length > 32:
+            hash_name = 'sha512'
+            salt += b'_sha512'
         
-        # Remover caracteres de padding y truncar
-        password = password.replace('=', '').replace('-', '_')[:length]
+        if self.kdf == 'argon2id':
+            # Memory-hard: cada intento de fuerza bruta necesita 64 MiB,
+            # lo que anula la ventaja de las GPU frente a PBKDF2
+            derived_key = hash_secret_raw(
+                secret=self.master_password,
+                salt=salt,
+                time_cost=3,
+                memory_cost=65536,
+                parallelism=2,
+                hash_len=dklen,
+                type=Argon2Type.ID
+            )
+        elif self.kdf == 'hkdf-all':
+            # Un solo PBKDF2 para todo el sistema; la clave estirada ya es
+            # pseudoaleatoria, así que sirve directamente de PRK
+            derived_key = _hkdf_expand(
+                self._stretched_master_key(iterations), service_name.encode('utf-8'), dklen
+            )
+        elif self.kdf == 'hkdf-secrets' and service_name in APP_SECRET_SERVICES:
+            prk = _hkdf_extract(salt, self._stretched_master_key(iterations))
+            derived_key = _hkdf_expand(prk, b'waifugen', dklen)
+        else:
+            derived_key = pbkdf2_hmac(
+                hash_name,
+                self.master_password,
+                salt,
+                iterations,
+                dklen=dklen
+            )
         
-        return password
+        # Base64 URL-safe sin padding y con '-' -> '_', en una sola pasada
+        raw = base64.urlsafe_b64encode(derived_key)
+        return raw.translate(_B64_MANGLE, _B64_STRIP)[:length].decode('ascii')
     
     def generate_all(self) -> Dict[str, str]:
         """
         Genera todas las contraseñas necesarias para el sistema WaifuGen.
         
+        Las derivaciones son independientes entre sí y pbkdf2_hmac (C)
+        libera el GIL durante el cálculo, así que se reparten en hilos.
+        El reparto es por servicio y no por bloque PBKDF2 (B_1, B_2...):
+        los backends en C solo devuelven la clave completa, y con Python
+        puro los bloques no escalan en hilos por el GIL.
+        
         Returns:
             Diccionario con todas las contraseñas generadas
         """
-        return {
-            'POSTGRES_PASSWORD': self.generate('postgres', 40),
-            'REDIS_PASSWORD': self.generate('redis', 40),
-            'SECRET_KEY': self.generate('secret_key', 64),
-            'GRAFANA_PASSWORD': self.generate('grafana', 40),
-            'JWT_SECRET': self.generate('jwt_secret', 64),
-            'ENCRYPTION_KEY': self.generate('encryption', 64),
-        }
+        workers = min(len(SERVICES), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            derived = executor.map(
+                lambda service: self.generate(service[1], service[2]), SERVICES
+            )
+            return {env_name: password for (env_name, _, _), password in zip(SERVICES, derived)}
+
+
+# Caché opcional (--cache) de contraseñas ya derivadas
+CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'waifugen'
+
 
+def _cache_path(master_password: str, kdf: str) -> Path:
+    """Ruta del caché para una contraseña maestra y un esquema concretos."""
+    fingerprint = hashlib.sha256(f"{kdf}:{master_password}".encode('utf-8')).hexdigest()[:32]
+    return CACHE_DIR / f"{fingerprint}.json"
 
-def print_passwords(passwords: Dict[str, str], format_type: str = 'env'):
+
+def load_cached_passwords(master_password: str, kdf: str = DEFAULT_KDF) -> Optional[Dict[str, str]]:
+    """
+    Carga las contraseñas cacheadas para esta contraseña maestra.
+    
+    Returns:
+        Diccionario de contraseñas, o None si no hay caché válido
+    """
+    try:
+        with open(_cache_path(master_password, kdf), encoding='utf-8') as f:
+            passwords = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if set(passwords) != {env_name for env_name, _, _ in SERVICES}:
+        return None
+    return passwords
+
+
+def save_cached_passwords(passwords: Dict[str, str], master_password: str, kdf: str = DEFAULT_KDF):
+    """
+    Guarda las contraseñas en el caché con permisos 0600.
+    
+    El archivo se crea con O_EXCL: si otra ejecución ya lo escribió, se
+    respeta el existente.
+    """
+    path = _cache_path(master_password, kdf)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(passwords, f)
+
+
+def print_passwords(passwords: Dict[str, str], format_type: str = 'env', kdf: str = DEFAULT_KDF):
     """
     Imprime las contraseñas en el formato especificado.
     
     Args:
         passwords: Diccionario de contraseñas
         format_type: Formato de salida ('env', 'json', 'table')
+        kdf: Esquema de derivación usado
     """
     if format_type == 'env':
-        print("# ============================================================================")
-        print("# CONTRASEÑAS GENERADAS - Sistema WaifuGen")
-        print("# ============================================================================")
-        print("# ADVERTENCIA: Estas contraseñas son sensibles. Guárdalas de forma segura.")
-        print("# Generadas usando derivación PBKDF2-HMAC-SHA256")
-        print("# ============================================================================")
-        print()
-        for key, value in passwords.items():
-            print(f"{key}={value}")
-        print()
-        print("# ============================================================================")
-        print("# IMPORTANTE: Copia estas contraseñas a tu archivo .env")
-        print("# ============================================================================")
+        # Todo el bloque en una sola escritura a stdout
+        lines = [
+            "# ============================================================================",
+            "# CONTRASEÑAS GENERADAS - Sistema WaifuGen",
+            "# ============================================================================",
+            "# ADVERTENCIA: Estas contraseñas son sensibles. Guárdalas de forma segura.",
+            f"# Generadas usando derivación {KDF_ALGORITHMS[kdf]}",
+            "# ============================================================================",
+            "",
+        ]
+        lines.extend(f"{key}={value}" for key, value in passwords.items())
+        lines += [
+            "",
+            "# ============================================================================",
+            "# IMPORTANTE: Copia estas contraseñas a tu archivo .env",
+            "# ============================================================================",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     elif format_type == 'json':
-        import json
         print(json.dumps(passwords, indent=2))
     
     elif format_type == 'table':
-        print("\n" + "="*80)
-        print(f"{'SERVICIO':<25} {'CONTRASEÑA':<55}")
-        print("="*80)
+        lines = ["", "="*80, f"{'SERVICIO':<25} {'CONTRASEÑA':<55}", "="*80]
         for key, value in passwords.items():
             # Mostrar solo los primeros y últimos caracteres por seguridad
             masked = f"{value[:8]}...{value[-8:]}" if len(value) > 20 else value
-            print(f"{key:<25} {masked:<55}")
-        print("="*80)
-        print("\n⚠️  Las contraseñas completas se han generado correctamente.")
-        print("   Usa --format env para ver las contraseñas completas.\n")
-
-
-def create_env_file(passwords: Dict[str, str], master_password: str, output_file: str = '.env'):
-    """
-    Crea un archivo .env completo con todas las variables de entorno.
-    
-    Args:
-        passwords: Diccionario de contraseñas generadas
-        master_password: Contraseña maestra (para mostrar en comentarios)
-        output_file: Ruta del archivo de salida
-    """
-    env_content = f"""# ============================================================================
+            lines.append(f"{key:<25} {masked:<55}")
+        lines += [
+            "="*80,
+            "",
+            "⚠️  Las contraseñas completas se han generado correctamente.",
+            "   Usa --format env para ver las contraseñas completas.",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+# Plantilla del .env; los campos son las variables de SERVICES más los datos
+# de generación que rellena create_env_file
+_ENV_TEMPLATE = """# ============================================================================
 # SISTEMA WAIFUGEN - VARIABLES DE ENTORNO
 # ============================================================================
 # ADVERTENCIA DE SEGURIDAD: Este archivo contiene credenciales sensibles
@@ -147,7 +404,8 @@ def create_env_file(passwords: Dict[str, str], master_password: str, output_file
 # ============================================================================
 # Contraseñas generadas automáticamente usando contraseña maestra
 # Contraseña maestra: {master_password}
-# Fecha de generación: {get_current_date()}
+# Derivación: {kdf_description}
+# Fecha de generación: {today}
 # ============================================================================
 
 # ============================================================================
@@ -163,26 +421,26 @@ LOG_LEVEL=INFO
 # ============================================================================
 POSTGRES_DB=waifugen_production
 POSTGRES_USER=waifugen_user
-POSTGRES_PASSWORD={passwords['POSTGRES_PASSWORD']}
+POSTGRES_PASSWORD={POSTGRES_PASSWORD}
 POSTGRES_PORT=5432
 
 # ============================================================================
 # CREDENCIALES DE REDIS CACHE
 # ============================================================================
-REDIS_PASSWORD={passwords['REDIS_PASSWORD']}
+REDIS_PASSWORD={REDIS_PASSWORD}
 REDIS_PORT=6379
 
 # ============================================================================
 # CLAVE SECRETA DE LA APLICACIÓN
 # ============================================================================
 # Usada para tokens JWT, firma de sesiones, encriptación
-SECRET_KEY={passwords['SECRET_KEY']}
+SECRET_KEY={SECRET_KEY}
 
 # ============================================================================
 # CLAVES ADICIONALES DE SEGURIDAD
 # ============================================================================
-JWT_SECRET={passwords['JWT_SECRET']}
-ENCRYPTION_KEY={passwords['ENCRYPTION_KEY']}
+JWT_SECRET={JWT_SECRET}
+ENCRYPTION_KEY={ENCRYPTION_KEY}
 
 # ============================================================================
 # CONFIGURACIÓN DE A2E API (REQUERIDO - Fase 1)
@@ -216,7 +474,7 @@ OLLAMA_PORT=11434
 # MONITOREO CON GRAFANA (OPCIONAL)
 # ============================================================================
 GRAFANA_USER=admin
-GRAFANA_PASSWORD={passwords['GRAFANA_PASSWORD']}
+GRAFANA_PASSWORD={GRAFANA_PASSWORD}
 
 # ============================================================================
 # PUERTO DE LA APLICACIÓN
@@ -239,11 +497,33 @@ WEBHOOK_URL=
 # ============================================================================
 # INFORMACIÓN DE ROTACIÓN
 # ============================================================================
-# Última generación: {get_current_date()}
-# Próxima rotación: {get_next_rotation_date()}
-# Para regenerar: python scripts/utilities/generate_passwords.py --master "{master_password}"
+# Última generación: {today}
+# Próxima rotación: {next_rotation}
+# Para regenerar: python scripts/utilities/generate_passwords.py --master "{master_password}"{kdf_flag}
 # ============================================================================
 """
+
+
+def create_env_file(passwords: Dict[str, str], master_password: str, output_file: str = '.env',
+                    kdf: str = DEFAULT_KDF):
+    """
+    Crea un archivo .env completo con todas las variables de entorno.
+    
+    Args:
+        passwords: Diccionario de contraseñas generadas
+        master_password: Contraseña maestra (para mostrar en comentarios)
+        output_file: Ruta del archivo de salida
+        kdf: Esquema de derivación usado
+    """
+    today = datetime.now()
+    env_content = _ENV_TEMPLATE.format_map({
+        **passwords,
+        'master_password': master_password,
+        'kdf_description': KDF_ALGORITHMS[kdf],
+        'kdf_flag': '' if kdf == DEFAULT_KDF else f' --kdf {kdf}',
+        'today': today.strftime('%Y-%m-%d'),
+        'next_rotation': (today + timedelta(days=90)).strftime('%Y-%m-%d'),
+    })
     
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write(env_content)
@@ -253,17 +533,16 @@ WEBHOOK_URL=
     print(f"🔒 Establece permisos seguros: chmod 600 {output_file}")
 
 
-def get_current_date() -> str:
-    """Obtiene la fecha actual en formato ISO."""
-    from datetime import datetime
-    return datetime.now().strftime('%Y-%m-%d')
-
-
-def get_next_rotation_date() -> str:
-    """Calcula la fecha de próxima rotación (+90 días)."""
-    from datetime import datetime, timedelta
-    next_rotation = datetime.now() + timedelta(days=90)
-    return next_rotation.strftime('%Y-%m-%d')
+def cpu_has_sha_ni() -> str:
+    """Indica si la CPU expone las extensiones SHA (solo detectable en Linux)."""
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    return 'sí' if 'sha_ni' in line.split() else 'no'
+    except OSError:
+        pass
+    return 'desconocido'
 
 
 def main():
@@ -284,6 +563,9 @@ Ejemplos de uso:
   
   # Mostrar en formato tabla
   python generate_passwords.py --format table
+  
+  # Reutilizar las contraseñas ya derivadas entre ejecuciones
+  python generate_passwords.py --cache --format table
         """
     )
     
@@ -294,6 +576,14 @@ Ejemplos de uso:
         help='Contraseña maestra para derivar todas las demás (por defecto: Otoñoazul82@)'
     )
     
+    parser.add_argument(
+        '--kdf',
+        type=str,
+        choices=list(KDF_ALGORITHMS),
+        default=DEFAULT_KDF,
+        help=f'Esquema de derivación (por defecto: {DEFAULT_KDF}; los demás generan otras contraseñas)'
+    )
+    
     parser.add_argument(
         '--format',
         type=str,
@@ -314,19 +604,35 @@ Ejemplos de uso:
         help='Verificar que las contraseñas son deterministas'
     )
     
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help=f'Reutilizar las contraseñas ya derivadas (guardadas en claro, 0600, en {CACHE_DIR})'
+    )
+    
     args = parser.parse_args()
     
     # Generar contraseñas
-    generator = PasswordGenerator(args.master)
-    passwords = generator.generate_all()
+    try:
+        generator = PasswordGenerator(args.master, args.kdf)
+    except ImportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    passwords = load_cached_passwords(args.master, args.kdf) if args.cache else None
+    if passwords is None:
+        passwords = generator.generate_all()
+        if args.cache:
+            save_cached_passwords(passwords, args.master, args.kdf)
     
     # Verificar determinismo si se solicita
     if args.verify:
         print("🔍 Verificando determinismo de contraseñas...")
-        generator2 = PasswordGenerator(args.master)
-        passwords2 = generator2.generate_all()
+        # El determinismo es del algoritmo, no de la instancia: basta con
+        # repetir una sola derivación en lugar de las seis
+        env_name, service_name, length = SERVICES[0]
         
-        if passwords == passwords2:
+        if generator.generate(service_name, length) == passwords[env_name]:
             print("✅ Verificación exitosa: Las contraseñas son deterministas")
         else:
             print("❌ Error: Las contraseñas no son deterministas")
@@ -334,25 +640,33 @@ Ejemplos de uso:
     
     # Guardar en archivo si se especifica
     if args.output:
-        create_env_file(passwords, args.master, args.output)
+        create_env_file(passwords, args.master, args.output, args.kdf)
     else:
         # Imprimir en el formato especificado
-        print_passwords(passwords, args.format)
+        print_passwords(passwords, args.format, args.kdf)
     
     # Mostrar información de seguridad
     if not args.output:
-        print("\n" + "="*80)
-        print("📋 INFORMACIÓN DE SEGURIDAD")
-        print("="*80)
-        print(f"✓ Contraseña maestra: {args.master}")
-        print(f"✓ Algoritmo: PBKDF2-HMAC-SHA256")
-        print(f"✓ Iteraciones: 100,000")
-        print(f"✓ Contraseñas generadas: {len(passwords)}")
-        print("\n⚠️  IMPORTANTE:")
-        print("   - Guarda la contraseña maestra en un lugar seguro")
-        print("   - Puedes regenerar estas contraseñas usando la misma contraseña maestra")
-        print("   - Nunca compartas las contraseñas generadas")
-        print("="*80 + "\n")
+        pbkdf2_info = "" if args.kdf == 'argon2id' else (
+            f"✓ Backend: {PBKDF2_BACKEND} (SHA-NI: {cpu_has_sha_ni()})\n"
+            f"✓ Iteraciones: 100,000\n"
+        )
+        sys.stdout.write(f"""
+{"="*80}
+📋 INFORMACIÓN DE SEGURIDAD
+{"="*80}
+✓ Contraseña maestra: {args.master}
+✓ Algoritmo: {KDF_ALGORITHMS[args.kdf]}
+{pbkdf2_info}✓ Contraseñas generadas: {len(passwords)}
+
+⚠️  IMPORTANTE:
+   - Guarda la contraseña maestra en un lugar seguro
+   - Puedes regenerar estas contraseñas usando la misma contraseña maestra
+   - Nunca compartas las contraseñas generadas
+{"="*80}
+
+""")
+        sys.stdout.flush()
 
 
 if __name__ == '__main__':
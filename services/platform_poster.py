@@ -3,43 +3,40 @@
 Platform Posting Utilities for WaifuGen
 Mock implementations for social media posting (to be replaced with real APIs)
 SECURED with API key authentication
+
+Production runs under gunicorn with threaded workers (see
+docker/platform_poster/Dockerfile):
+    gunicorn -k gthread -w 2 --threads 8 -b 0.0.0.0:8080 platform_poster:app
+`python platform_poster.py` starts the single-threaded Flask dev server.
 """
 
 import os
 import logging
+import threading
 import time
 import random
+import secrets
 from typing import Dict, Optional
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, jsonify
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from service_common import ApiKeyAuth, install_json_provider
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+install_json_provider(app)
 
 # Security: API Key from environment
 API_KEY = os.getenv('PLATFORM_POSTER_API_KEY')
 if not API_KEY:
     logger.error("PLATFORM_POSTER_API_KEY not set! Service will reject all requests.")
-
-
-def require_api_key(f):
-    """Decorator to require API key authentication"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        api_key = request.headers.get('X-API-Key')
-        
-        if not api_key:
-            logger.warning(f"Request without API key from {request.remote_addr}")
-            return jsonify({'error': 'API key required'}), 401
-        
-        if api_key != API_KEY:
-            logger.warning(f"Invalid API key attempt from {request.remote_addr}")
-            return jsonify({'error': 'Invalid API key'}), 401
-        
-        return f(*args, **kwargs)
-    return decorated_function
+_auth = ApiKeyAuth(API_KEY, logger)
+require_api_key = _auth.require
 
 
 # Proxy Configuration
@@ -47,9 +44,45 @@ PROXY_URL = os.getenv('PROXY_URL')
 if PROXY_URL:
     logger.info(f"Global Proxy Configured: {PROXY_URL}")
 
+# Simulated upload latency for the mock posters: off by default so the
+# workers are not held for nothing; set >0 to mimic a slow platform
+MOCK_DELAY_MAX = float(os.getenv('MOCK_UPLOAD_DELAY_MAX', '0'))
+
 class PlatformPoster:
     """Base class for platform posting"""
     
+    # One keep-alive session shared by every poster subclass
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+    
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Shared HTTP session for the real platform API calls, created on first use.
+        
+        Pooled connections and retries on 429/5xx, with the global proxy
+        preconfigured, so consecutive uploads reuse the TLS connection.
+        """
+        if PlatformPoster._session is None:
+            with PlatformPoster._session_lock:
+                if PlatformPoster._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=10,
+                        pool_maxsize=20,
+                        max_retries=Retry(
+                            total=3,
+                            backoff_factor=0.5,
+                            status_forcelist=[429, 500, 502, 503, 504]
+                        )
+                    )
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    if PROXY_URL:
+                        session.proxies = {'http': PROXY_URL, 'https': PROXY_URL}
+                    PlatformPoster._session = session
+        return PlatformPoster._session
+    
     def __init__(self, platform_name: str):
         self.platform_name = platform_name
         self.proxies = {'http': PROXY_URL, 'https': PROXY_URL} if PROXY_URL else None
@@ -64,11 +97,14 @@ class PlatformPoster:
         logger.info(f"[{self.platform_name}] Uploading video: {video_url}")
         logger.info(f"[{self.platform_name}] Caption: {caption}")
         
-        # Simulate upload delay
-        time.sleep(random.uniform(1, 3))
+        # Simulate upload delay (opt-in, see MOCK_UPLOAD_DELAY_MAX)
+        if MOCK_DELAY_MAX > 0:
+            time.sleep(random.uniform(0, MOCK_DELAY_MAX))
         
-        # Mock response
-        post_id = f"mock_{self.platform_name}_{int(time.time())}"
+        # Mock response: one clock read, plus a random suffix so concurrent
+        # (fanout) uploads within the same tick never share a post_id
+        ts_ns = time.time_ns()
+        post_id = f"mock_{self.platform_name}_{ts_ns}_{secrets.token_hex(4)}"
         
         return {
             'success': True,
@@ -76,7 +112,7 @@ class PlatformPoster:
             'platform': self.platform_name,
             'video_url': video_url,
             'post_url': f"https://{self.platform_name}.com/post/{post_id}",
-            'timestamp': time.time(),
+            'timestamp': ts_ns / 1e9,
             'proxy_used': bool(self.proxies)
         }
 
@@ -168,12 +204,15 @@ class OnlyFansPoster(PlatformPoster):
         # TODO: Replace with actual OnlyFans API or Selenium automation
         # OnlyFans requires web scraping or unofficial API
         
+        ts_ns = time.time_ns()
+        post_id = f"mock_onlyfans_{ts_ns}_{secrets.token_hex(4)}"
+        
         result = {
             'success': True,
-            'post_id': f"mock_onlyfans_{int(time.time())}",
+            'post_id': post_id,
             'platform': 'onlyfans',
-            'post_url': f"https://onlyfans.com/post/mock_{int(time.time())}",
-            'timestamp': time.time(),
+            'post_url': f"https://onlyfans.com/post/{post_id}",
+            'timestamp': ts_ns / 1e9,
             'platform_specific': {
                 'pricing_tier': pricing_tier,
                 'is_ppv': pricing_tier > 0,
@@ -184,6 +223,15 @@ class OnlyFansPoster(PlatformPoster):
         return result
 
 
+# Posters reachable through the fanout endpoint
+_POSTERS = {
+    'tiktok': TikTokPoster,
+    'instagram': InstagramPoster,
+    'youtube': YouTubePoster,
+    'onlyfans': OnlyFansPoster,
+}
+
+
 # Flask API endpoints
 
 @app.route('/api/tiktok/upload', methods=['POST'])
@@ -303,6 +351,58 @@ def xvideos_upload():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/fanout/upload', methods=['POST'])
+@require_api_key
+def fanout_upload():
+    """
+    Upload to several platforms concurrently in one call.
+    
+    Body: {"platforms": ["tiktok", "youtube"], "tiktok": {...}, "youtube": {...}}
+    where each per-platform object (required) holds that platform's
+    upload_video arguments. Responds with one result (or error) per platform.
+    """
+    try:
+        data = request.json or {}
+        platforms = data.get('platforms')
+        if not isinstance(platforms, list) or not all(isinstance(p, str) for p in platforms):
+            return jsonify({'error': 'platforms must be a list of platform names'}), 400
+        platforms = list(dict.fromkeys(platforms))
+        if not platforms:
+            return jsonify({'error': 'platforms is required'}), 400
+        
+        unknown = [p for p in platforms if p not in _POSTERS]
+        if unknown:
+            return jsonify({'error': f"Unsupported platforms: {', '.join(unknown)}"}), 400
+        
+        not_objects = [p for p in platforms if not isinstance(data.get(p), dict)]
+        if not_objects:
+            return jsonify({'error': f"Missing or non-object upload arguments for: {', '.join(not_objects)}"}), 400
+        
+        kwargs = {platform: dict(data[platform]) for platform in platforms}
+        if 'onlyfans' in kwargs:
+            # Same default as /api/onlyfans/upload
+            kwargs['onlyfans'].setdefault('pricing_tier', 0)
+        
+        with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+            futures = {
+                platform: executor.submit(_POSTERS[platform]().upload_video, **kwargs[platform])
+                for platform in platforms
+            }
+        
+        results = {}
+        for platform, future in futures.items():
+            try:
+                results[platform] = future.result()
+            except Exception as e:
+                logger.error(f"Fanout upload error ({platform}): {e}")
+                results[platform] = {'success': False, 'platform': platform, 'error': str(e)}
+        
+        return jsonify(results), 200
+    except Exception as e:
+        logger.error(f"Fanout upload error: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check"""
@@ -310,4 +410,5 @@ def health_check():
 
 
 if __name__ == '__main__':
+    # Development only; see the module docstring for the gunicorn command
     app.run(host='0.0.0.0', port=8080, debug=False)
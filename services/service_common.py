@@ -0,0 +1,98 @@
+"""
+Shared helpers for the WaifuGen Flask microservices
+
+JSON provider and API key authentication used by thumbnail_service.py and
+platform_poster.py. Each service's Dockerfile copies this module next to
+the service, which imports it as a sibling (`from service_common import ...`).
+"""
+
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from functools import wraps
+from typing import Dict, Optional
+
+from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+# orjson (optional): faster JSON encoding/decoding than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (request bodies and jsonify)"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, default=self.default,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def install_json_provider(app: Flask) -> None:
+    """Switch the app's JSON handling to orjson when it is installed"""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+
+class ApiKeyAuth:
+    """
+    X-API-Key authentication for one service.
+    
+    Keys are compared in constant time, and accepted keys are remembered
+    (blake2b digest -> expiry) for AUTH_CACHE_TTL seconds. The compare is
+    cheap today, but a multi-key or DB-backed lookup would then run once
+    per key per TTL.
+    """
+    
+    AUTH_CACHE_TTL = 300
+    AUTH_CACHE_MAXSIZE = 1024
+    
+    def __init__(self, api_key: Optional[str], logger: Optional[logging.Logger] = None):
+        self.api_key = api_key
+        self.logger = logger or logging.getLogger(__name__)
+        self._cache: Dict[bytes, float] = {}
+        self._lock = threading.Lock()
+    
+    def is_valid(self, api_key: str) -> bool:
+        """Constant-time API key check, with a short TTL cache of accepted keys"""
+        digest = hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+        now = time.monotonic()
+        with self._lock:
+            expiry = self._cache.get(digest)
+            if expiry is not None and expiry > now:
+                return True
+        
+        if not self.api_key or not hmac.compare_digest(api_key.encode(), self.api_key.encode()):
+            return False
+        
+        with self._lock:
+            if len(self._cache) >= self.AUTH_CACHE_MAXSIZE:
+                self._cache.clear()
+            self._cache[digest] = now + self.AUTH_CACHE_TTL
+        return True
+    
+    def require(self, f):
+        """Decorator to require API key authentication"""
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            api_key = request.headers.get('X-API-Key')
+            
+            if not api_key:
+                self.logger.warning(f"Request without API key from {request.remote_addr}")
+                return jsonify({'error': 'API key required'}), 401
+            
+            if not self.is_valid(api_key):
+                self.logger.warning(f"Invalid API key attempt from {request.remote_addr}")
+                return jsonify({'error': 'Invalid API key'}), 401
+            
+            return f(*args, **kwargs)
+        return decorated_function
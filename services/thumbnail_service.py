@@ -4,16 +4,39 @@ Secured Thumbnail Service with API Key Authentication
 Fixes: Missing authentication vulnerability
 """
 
+import io
 import os
+import re
+import queue
+import shutil
+import zipfile
+import hashlib
 import subprocess
 import tempfile
+import threading
+import time
 import logging
 from pathlib import Path
-from typing import Dict, Tuple
-from functools import wraps
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from flask import Flask, request, jsonify, send_file
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont, ImageOps, features
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from service_common import ApiKeyAuth, install_json_provider
+
+# PyAV (optional): decodes in-process with libav instead of forking ffmpeg
+try:
+    import av
+except ImportError:
+    av = None
 
 # Configure logging (sanitized)
 logging.basicConfig(
@@ -23,51 +46,109 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+install_json_provider(app)
 
 # Security: API Key from environment
 API_KEY = os.getenv('THUMBNAIL_SERVICE_API_KEY')
 if not API_KEY:
     logger.error("THUMBNAIL_SERVICE_API_KEY not set! Service will reject all requests.")
+_auth = ApiKeyAuth(API_KEY, logger)
+require_api_key = _auth.require
+
+# Protocols a remote video may use (keeps a playlist from pulling in file://)
+_REMOTE_PROTOCOLS = 'http,https,tcp,tls,crypto'
+
+# Concurrent frame decodes per worker: batch/extract pools could otherwise
+# start one CPU-heavy ffmpeg per thread and oversubscribe the cores
+_FFMPEG_SEM = threading.BoundedSemaphore(max(1, (os.cpu_count() or 2) // 2))
+
+# Shared HTTP session: keeps TCP/TLS connections to the video CDN alive
+# across thumbnail requests instead of re-handshaking on every download
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+# Reusable 1 MiB copy buffers for full video downloads, so each download
+# doesn't allocate its own and writes hit the disk in large chunks
+_BUF_SIZE = 1 << 20
+_BUF_POOL: "queue.LifoQueue[bytearray]" = queue.LifoQueue()
+
+
+def _acquire_buffer() -> bytearray:
+    """Take a copy buffer from the pool, allocating one if it's empty"""
+    try:
+        return _BUF_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(_BUF_SIZE)
+
+
+def _release_buffer(buf: bytearray) -> None:
+    """Return a copy buffer to the pool"""
+    _BUF_POOL.put(buf)
+
+@dataclass(frozen=True, slots=True)
+class PlatformConfig:
+    """Output geometry and encoding for one platform"""
+    width: int
+    height: int
+    aspect_ratio: str
+    format: str
+    quality: int
+
+
+@dataclass(frozen=True, slots=True)
+class CharacterColors:
+    """Brand colors for one character"""
+    primary: str
+    secondary: str
+
 
 # Platform configurations
 PLATFORM_CONFIGS = {
-    'tiktok': {'width': 1080, 'height': 1920, 'aspect_ratio': '9:16', 'format': 'JPEG', 'quality': 90},
-    'instagram': {'width': 1080, 'height': 1920, 'aspect_ratio': '9:16', 'format': 'JPEG', 'quality': 90},
-    'youtube': {'width': 1280, 'height': 720, 'aspect_ratio': '16:9', 'format': 'JPEG', 'quality': 95}
+    'tiktok': PlatformConfig(1080, 1920, '9:16', 'JPEG', 90),
+    'instagram': PlatformConfig(1080, 1920, '9:16', 'JPEG', 90),
+    'youtube': PlatformConfig(1280, 720, '16:9', 'JPEG', 95)
 }
 
 CHARACTER_COLORS = {
-    'Miyuki Sakura': {'primary': '#FF69B4', 'secondary': '#FFB6C1'},
-    'Airi Neo': {'primary': '#9D4EDD', 'secondary': '#C77DFF'},
-    'Aiko Hayashi': {'primary': '#E63946', 'secondary': '#F1FAEE'},
-    'Rio Mizuno': {'primary': '#06FFA5', 'secondary': '#FFFB46'},
-    'Chiyo Sasaki': {'primary': '#8B4513', 'secondary': '#D2691E'},
-    'default': {'primary': '#FF1493', 'secondary': '#FFB6C1'}
+    'Miyuki Sakura': CharacterColors('#FF69B4', '#FFB6C1'),
+    'Airi Neo': CharacterColors('#9D4EDD', '#C77DFF'),
+    'Aiko Hayashi': CharacterColors('#E63946', '#F1FAEE'),
+    'Rio Mizuno': CharacterColors('#06FFA5', '#FFFB46'),
+    'Chiyo Sasaki': CharacterColors('#8B4513', '#D2691E'),
+    'default': CharacterColors('#FF1493', '#FFB6C1')
 }
 
+# Fonts are parsed once at import instead of on every thumbnail
+try:
+    _FONT_LARGE = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 80)
+    _FONT_SMALL = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 40)
+except OSError:
+    logger.warning("DejaVu fonts not found, using PIL default font")
+    _FONT_LARGE = ImageFont.load_default()
+    _FONT_SMALL = ImageFont.load_default()
 
-def require_api_key(f):
-    """Decorator to require API key authentication"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        api_key = request.headers.get('X-API-Key')
-        
-        if not api_key:
-            logger.warning(f"Request without API key from {request.remote_addr}")
-            return jsonify({'error': 'API key required'}), 401
-        
-        if api_key != API_KEY:
-            logger.warning(f"Invalid API key attempt from {request.remote_addr}")
-            return jsonify({'error': 'Invalid API key'}), 401
-        
-        return f(*args, **kwargs)
-    return decorated_function
+# JPEG encoding is the heaviest step after decoding; libjpeg-turbo's SIMD
+# DCT is several times faster than stock libjpeg
+JPEG_TURBO = bool(features.check_feature('libjpeg_turbo'))
+if not JPEG_TURBO:
+    logger.warning("Pillow is not built against libjpeg-turbo; JPEG encoding will be slower")
+
+
+# Input validation patterns, compiled once
+_URL_RE = re.compile(r'^https?://')
+_BAD_NAME_RE = re.compile(r'[/\\<>|]|\.\.')
 
 
 def validate_input(video_url: str, platform: str, character_name: str) -> Tuple[bool, str]:
     """Validate and sanitize inputs"""
     # Validate URL
-    if not video_url or not video_url.startswith(('http://', 'https://')):
+    if not video_url or not _URL_RE.match(video_url):
         return False, "Invalid video URL"
     
     # Validate platform
@@ -78,12 +159,49 @@ def validate_input(video_url: str, platform: str, character_name: str) -> Tuple[
     if not character_name or len(character_name) > 100:
         return False, "Invalid character name"
     
-    if any(char in character_name for char in ['/', '\\', '..', '<', '>', '|']):
+    if _BAD_NAME_RE.search(character_name):
         return False, "Character name contains invalid characters"
     
     return True, "OK"
 
 
+@lru_cache(maxsize=8)
+def _bottom_gradient(width: int, height: int = 300, max_alpha: int = 180) -> Image.Image:
+    """
+    Black RGBA strip whose alpha ramps 0 -> max_alpha row by row.
+    
+    Only depends on the frame width (one per platform), so it is built once
+    and shared; paste() never mutates its source image.
+    """
+    rgba = np.zeros((height, width, 4), dtype=np.uint8)
+    rgba[..., 3] = (np.arange(height) * max_alpha // height).astype(np.uint8)[:, None]
+    return Image.fromarray(rgba, 'RGBA')
+
+
+def _blend_mask(arr: np.ndarray, mask: np.ndarray, x: int, y: int,
+                color: Tuple[int, int, int], opacity: int = 255) -> None:
+    """
+    Blend a solid color into an RGB array in place through an alpha mask.
+    
+    Args:
+        arr: (H, W, 3) uint8 image array
+        mask: (h, w) uint8 coverage mask (e.g. rasterized glyphs)
+        x, y: Position of the mask's top-left corner (may be partly outside)
+        color: RGB color to blend in
+        opacity: Extra opacity applied on top of the mask (0-255)
+    """
+    h, w = mask.shape
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, arr.shape[1]), min(y + h, arr.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    
+    alpha = mask[y0 - y:y1 - y, x0 - x:x1 - x, None] * (opacity / (255.0 * 255.0))
+    region = arr[y0:y1, x0:x1]
+    blended = region * (1.0 - alpha) + np.asarray(color, dtype=np.float32) * alpha
+    region[...] = (blended + 0.5).astype(np.uint8)
+
+
 class ThumbnailGenerator:
     """Generates platform-optimized thumbnails"""
     
@@ -100,12 +218,23 @@ class ThumbnailGenerator:
         try:
             # Sanitized logging (no full URL)
             logger.info(f"Downloading video for {self.character_name}")
-            response = requests.get(self.video_url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with _SESSION.get(self.video_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                # Read straight from the socket into a pooled buffer: one
+                # 1 MiB write per iteration instead of 8 KB Python chunks
+                response.raw.decode_content = True
+                buf = _acquire_buffer()
+                view = memoryview(buf)
+                try:
+                    with open(output_path, 'wb') as f:
+                        while True:
+                            n = response.raw.readinto(view)
+                            if not n:
+                                break
+                            f.write(view[:n])
+                finally:
+                    view.release()
+                    _release_buffer(buf)
             
             logger.info(f"Video downloaded successfully")
             return True
@@ -113,20 +242,76 @@ class ThumbnailGenerator:
             logger.error(f"Failed to download video: {type(e).__name__}")
             return False
     
-    def extract_frame(self, video_path: str, output_path: str, timestamp: float = 3.0) -> bool:
-        """Extract frame from video using FFmpeg"""
+    def extract_frame(self, source: str, output_path: str, timestamp: float = 3.0) -> bool:
+        """
+        Extract frame from a local video file or a remote URL.
+        
+        Uses PyAV in-process when installed (no fork/exec or libav start-up
+        per thumbnail) and the ffmpeg CLI otherwise, or if PyAV fails.
+        At most _FFMPEG_SEM decodes run at once.
+        """
+        with _FFMPEG_SEM:
+            if av is not None:
+                try:
+                    if self._extract_frame_av(source, output_path, timestamp):
+                        return True
+                except Exception as e:
+                    logger.warning(f"PyAV extraction failed, using ffmpeg: {type(e).__name__}")
+            
+            return self._extract_frame_ffmpeg(source, output_path, timestamp)
+    
+    def _extract_frame_av(self, source: str, output_path: str, timestamp: float) -> bool:
+        """Seek and decode one frame with PyAV, then scale+pad like the ffmpeg filter"""
+        options = {}
+        if source.startswith(('http://', 'https://')):
+            options['protocol_whitelist'] = _REMOTE_PROTOCOLS
+        
+        container = av.open(source, options=options, timeout=30)
+        try:
+            stream = container.streams.video[0]
+            # Seeks to the keyframe before the timestamp; decode forward to it
+            container.seek(int(timestamp * av.time_base))
+            for frame in container.decode(stream):
+                if frame.time is None or frame.time >= timestamp:
+                    break
+            else:
+                return False
+            
+            image = ImageOps.pad(frame.to_image(), (self.config.width, self.config.height), color='black')
+            image.save(output_path, 'JPEG', quality=95)
+        finally:
+            container.close()
+        
+        logger.info(f"Frame extracted successfully (PyAV)")
+        return True
+    
+    def _extract_frame_ffmpeg(self, source: str, output_path: str, timestamp: float) -> bool:
+        """
+        Extract frame with the ffmpeg CLI.
+        
+        -ss goes before -i (input seek): ffmpeg jumps to the timestamp instead
+        of decoding up to it, and for a URL it only range-requests the bytes
+        it needs rather than the whole video.
+        """
         try:
-            cmd = [
-                'ffmpeg',
-                '-i', video_path,
+            # Cap codec threads: parallelism comes from concurrent processes
+            cmd = ['ffmpeg', '-nostdin', '-hide_banner', '-loglevel', 'error', '-threads', '2']
+            if source.startswith(('http://', 'https://')):
+                # Don't let a remote playlist pull in file:// or other protocols
+                cmd += ['-protocol_whitelist', _REMOTE_PROTOCOLS]
+            cmd += [
                 '-ss', str(timestamp),
-                '-vframes', '1',
-                '-vf', f'scale={self.config["width"]}:{self.config["height"]}:force_original_aspect_ratio=decrease,pad={self.config["width"]}:{self.config["height"]}:(ow-iw)/2:(oh-ih)/2',
+                '-i', source,
+                '-frames:v', '1',
+                '-vf', f'scale={self.config.width}:{self.config.height}:force_original_aspect_ratio=decrease,pad={self.config.width}:{self.config.height}:(ow-iw)/2:(oh-ih)/2',
                 '-y',
                 output_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            # Output is never read (logs stay sanitized), so don't buffer or
+            # decode it; run() kills ffmpeg if the timeout expires
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL, timeout=30)
             
             if result.returncode == 0:
                 logger.info(f"Frame extracted successfully")
@@ -138,85 +323,229 @@ class ThumbnailGenerator:
             logger.error(f"Failed to extract frame: {type(e).__name__}")
             return False
     
-    def add_overlay(self, frame_path: str, output_path: str) -> bool:
-        """Add text overlay and branding to frame"""
+    def add_overlay(self, frame_path: str) -> Optional[bytes]:
+        """Add text overlay and branding to frame; returns the encoded thumbnail"""
         try:
             img = Image.open(frame_path)
             draw = ImageDraw.Draw(img)
             
-            # Add gradient overlay at bottom
-            gradient = Image.new('RGBA', (img.width, 300), (0, 0, 0, 0))
-            gradient_draw = ImageDraw.Draw(gradient)
-            
-            for i in range(300):
-                alpha = int((i / 300) * 180)
-                gradient_draw.rectangle([(0, i), (img.width, i + 1)], fill=(0, 0, 0, alpha))
-            
+            # Add gradient overlay at bottom (cached per frame width)
+            gradient = _bottom_gradient(img.width)
             img.paste(gradient, (0, img.height - 300), gradient)
             draw = ImageDraw.Draw(img)
             
-            # Load font
-            try:
-                font_large = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 80)
-                font_small = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 40)
-            except:
-                font_large = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-            
-            # Draw character name
-            text_bbox = draw.textbbox((0, 0), self.text_overlay, font=font_large)
+            # Draw character name: rasterize the glyphs once into a mask and
+            # composite both the shadow (+3,+3, alpha 200) and the main text
+            # from it, instead of running the text renderer twice
+            text_bbox = draw.textbbox((0, 0), self.text_overlay, font=_FONT_LARGE)
             text_width = text_bbox[2] - text_bbox[0]
             text_x = (img.width - text_width) // 2
             text_y = img.height - 200
             
-            # Text shadow
-            draw.text((text_x + 3, text_y + 3), self.text_overlay, font=font_large, fill=(0, 0, 0, 200))
-            # Main text
-            draw.text((text_x, text_y), self.text_overlay, font=font_large, fill=self.colors['primary'])
+            mask_image = Image.new('L', (max(text_bbox[2], 1), max(text_bbox[3], 1)), 0)
+            ImageDraw.Draw(mask_image).text((0, 0), self.text_overlay, font=_FONT_LARGE, fill=255)
+            mask = np.asarray(mask_image)
+            
+            arr = np.array(img.convert('RGB'))
+            _blend_mask(arr, mask, text_x + 3, text_y + 3, (0, 0, 0), opacity=200)
+            _blend_mask(arr, mask, text_x, text_y, ImageColor.getrgb(self.colors.primary))
+            img = Image.fromarray(arr, 'RGB')
+            draw = ImageDraw.Draw(img)
             
             # Watermark
             watermark = "WaifuGen"
-            watermark_bbox = draw.textbbox((0, 0), watermark, font=font_small)
+            watermark_bbox = draw.textbbox((0, 0), watermark, font=_FONT_SMALL)
             watermark_width = watermark_bbox[2] - watermark_bbox[0]
             watermark_x = img.width - watermark_width - 30
             watermark_y = 30
             
-            draw.text((watermark_x, watermark_y), watermark, font=font_small, fill=(255, 255, 255, 180))
+            draw.text((watermark_x, watermark_y), watermark, font=_FONT_SMALL, fill=(255, 255, 255, 180))
             
-            # Save
-            img.save(output_path, self.config['format'], quality=self.config['quality'])
+            # Encode into memory (progressive, 4:2:0, no extra Huffman
+            # optimization pass); the response is served from these bytes
+            buffer = io.BytesIO()
+            img.save(buffer, self.config.format, quality=self.config.quality,
+                     optimize=False, progressive=True, subsampling=2)
             logger.info(f"Overlay added successfully")
-            return True
+            return buffer.getvalue()
             
         except Exception as e:
             logger.error(f"Failed to add overlay: {type(e).__name__}")
-            return False
+            return None
     
-    def generate(self) -> Tuple[bool, str]:
-        """Main generation flow"""
+    def prepare_frame(self) -> Tuple[bool, str]:
+        """
+        Stage 1: grab the source frame (network + FFmpeg) into a temp dir.
+        
+        The temp dir is removed on failure here, and by render() on success.
+        """
         temp_dir = tempfile.mkdtemp()
+        frame_path = os.path.join(temp_dir, 'frame.jpg')
         
         try:
-            video_path = os.path.join(temp_dir, 'video.mp4')
-            frame_path = os.path.join(temp_dir, 'frame.jpg')
-            thumbnail_path = os.path.join(temp_dir, 'thumbnail.jpg')
-            
-            if not self.download_video(video_path):
-                return False, "Failed to download video"
-            
-            if not self.extract_frame(video_path, frame_path):
-                return False, "Failed to extract frame"
-            
-            if not self.add_overlay(frame_path, thumbnail_path):
-                return False, "Failed to add overlay"
+            # Let ffmpeg seek in the remote file directly; only download the
+            # whole video if the host refuses ffmpeg (e.g. blocks its user
+            # agent). A local file rather than a stdin pipe, because MP4s
+            # with the moov atom at the end can't be decoded from a pipe.
+            if not self.extract_frame(self.video_url, frame_path):
+                logger.info("Direct seek failed, falling back to full download")
+                video_path = os.path.join(temp_dir, 'video.mp4')
+                
+                if not self.download_video(video_path):
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    return False, "Failed to download video"
+                
+                if not self.extract_frame(video_path, frame_path):
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    return False, "Failed to extract frame"
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        
+        return True, frame_path
+    
+    def render(self, frame_path: str) -> Tuple[bool, Union[bytes, str]]:
+        """Stage 2: overlay text and branding onto the extracted frame (PIL)"""
+        try:
+            data = self.add_overlay(frame_path)
+        finally:
+            shutil.rmtree(os.path.dirname(frame_path), ignore_errors=True)
+        
+        if data is None:
+            return False, "Failed to add overlay"
+        
+        return True, data
+    
+    def generate(self) -> Tuple[bool, Union[bytes, str]]:
+        """Main generation flow; returns (True, JPEG bytes) or (False, error)"""
+        try:
+            success, result = self.prepare_frame()
+            if not success:
+                return False, result
             
-            return True, thumbnail_path
+            return self.render(result)
             
         except Exception as e:
             logger.error(f"Thumbnail generation failed: {type(e).__name__}")
             return False, str(e)
 
 
+class BatchGenerator:
+    """
+    Generates many thumbnails with the stages pipelined.
+    
+    Frame extraction (network + FFmpeg) and overlay rendering (PIL) run in
+    separate pools, so while one job is being rendered the next ones are
+    already fetching: wall time tends to the slowest stage instead of the
+    sum of all of them.
+    """
+    
+    def __init__(self, extract_workers: int = 8, render_workers: int = 4):
+        self.extract_workers = extract_workers
+        self.render_workers = render_workers
+    
+    def _safe(self, stage, *args) -> Tuple[bool, Union[bytes, str]]:
+        try:
+            return stage(*args)
+        except Exception as e:
+            logger.error(f"Batch thumbnail stage failed: {type(e).__name__}")
+            return False, str(e)
+    
+    def run(self, generators: List[ThumbnailGenerator]) -> List[Tuple[bool, Union[bytes, str]]]:
+        """Run all jobs and return (success, JPEG bytes or error) in input order"""
+        results: List[Tuple[bool, Union[bytes, str]]] = [(False, "Not processed")] * len(generators)
+        
+        with ThreadPoolExecutor(max_workers=self.extract_workers) as extract_pool, \
+                ThreadPoolExecutor(max_workers=self.render_workers) as render_pool:
+            extract_futures = {
+                extract_pool.submit(self._safe, gen.prepare_frame): i
+                for i, gen in enumerate(generators)
+            }
+            render_futures = {}
+            
+            for future in as_completed(extract_futures):
+                i = extract_futures[future]
+                success, result = future.result()
+                if success:
+                    render_futures[render_pool.submit(self._safe, generators[i].render, result)] = i
+                else:
+                    results[i] = (False, result)
+            
+            for future in as_completed(render_futures):
+                results[render_futures[future]] = future.result()
+        
+        return results
+
+
+# Recently generated thumbnails (key -> (expiry, JPEG bytes)), LRU-bounded.
+# 128 entries of up to ~0.5 MB stay well inside the container's 512 MB.
+RESULT_CACHE_TTL = 600
+_RESULT_CACHE_MAXSIZE = 128
+_result_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+# Generations in progress, so identical concurrent requests share one
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+# Longest a request waits on an identical generation (download + ffmpeg
+# timeouts are 30s each, plus image work)
+COALESCE_WAIT_TIMEOUT = 120
+
+
+def _generate_coalesced(generator: ThumbnailGenerator) -> Tuple[bool, Union[bytes, str]]:
+    """
+    Generate a thumbnail, sharing work between identical requests.
+    
+    The first request for a (video, platform, character, text) key runs the
+    generator; concurrent ones wait for its result, and later ones within
+    RESULT_CACHE_TTL get the cached bytes. Failures are not cached; waiters
+    give up after COALESCE_WAIT_TIMEOUT seconds.
+    """
+    key = hashlib.blake2b(
+        f"{generator.video_url}|{generator.platform}|{generator.character_name}|{generator.text_overlay}".encode(),
+        digest_size=16
+    ).hexdigest()
+    
+    with _inflight_lock:
+        cached = _result_cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                _result_cache.move_to_end(key)
+                return True, cached[1]
+            del _result_cache[key]
+        
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[key] = future
+    
+    if not owner:
+        try:
+            return future.result(timeout=COALESCE_WAIT_TIMEOUT)
+        except FutureTimeoutError:
+            return False, 'Timed out waiting for thumbnail generation'
+    
+    # Waiters must always be released, even if generate() dies with a
+    # BaseException (the key would otherwise block every later request)
+    result = (False, 'Thumbnail generation aborted')
+    try:
+        result = generator.generate()
+    except Exception as e:
+        result = (False, str(e))
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+            if result[0]:
+                _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL, result[1])
+                while len(_result_cache) > _RESULT_CACHE_MAXSIZE:
+                    _result_cache.popitem(last=False)
+        future.set_result(result)
+    return result
+
+
+# Upper bound on jobs per /generate_batch request
+MAX_BATCH_SIZE = 50
+
+
 @app.route('/generate', methods=['POST'])
 @require_api_key  # ← SECURITY: Require API key
 def generate_thumbnail():
@@ -234,12 +563,12 @@ def generate_thumbnail():
             logger.warning(f"Invalid input: {error}")
             return jsonify({'error': error}), 400
         
-        # Generate thumbnail
+        # Generate thumbnail (or join an identical one already running)
         generator = ThumbnailGenerator(video_url, platform, character_name, text_overlay)
-        success, result = generator.generate()
+        success, result = _generate_coalesced(generator)
         
         if success:
-            return send_file(result, mimetype='image/jpeg', as_attachment=True, download_name='thumbnail.jpg')
+            return send_file(io.BytesIO(result), mimetype='image/jpeg', as_attachment=True, download_name='thumbnail.jpg')
         else:
             return jsonify({'error': result}), 500
             
@@ -248,13 +577,65 @@ def generate_thumbnail():
         return jsonify({'error': 'Internal server error'}), 500
 
 
+@app.route('/generate_batch', methods=['POST'])
+@require_api_key
+def generate_thumbnail_batch():
+    """
+    API endpoint to generate several thumbnails in one call.
+    
+    Body: JSON list of {video_url, platform, character_name, text_overlay}.
+    Returns a zip with NN_platform.jpg per successful job plus errors.json.
+    """
+    try:
+        jobs = request.get_json(silent=True)
+        if not isinstance(jobs, list) or not jobs:
+            return jsonify({'error': 'Expected a non-empty JSON list of jobs'}), 400
+        if len(jobs) > MAX_BATCH_SIZE:
+            return jsonify({'error': f'At most {MAX_BATCH_SIZE} jobs per batch'}), 400
+        
+        generators = []
+        for i, job in enumerate(jobs):
+            if not isinstance(job, dict):
+                return jsonify({'error': f'Job {i} must be an object'}), 400
+            video_url = job.get('video_url')
+            platform = job.get('platform', 'tiktok')
+            character_name = job.get('character_name', 'WaifuGen')
+            
+            valid, error = validate_input(video_url, platform, character_name)
+            if not valid:
+                logger.warning(f"Invalid batch input: {error}")
+                return jsonify({'error': f'Job {i}: {error}'}), 400
+            
+            generators.append(ThumbnailGenerator(video_url, platform, character_name, job.get('text_overlay', '')))
+        
+        results = BatchGenerator().run(generators)
+        
+        buffer = io.BytesIO()
+        errors = {}
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:
+            for i, (gen, (success, result)) in enumerate(zip(generators, results)):
+                if success:
+                    archive.writestr(f"{i:02d}_{gen.platform}.jpg", result)
+                else:
+                    errors[i] = result
+            archive.writestr('errors.json', app.json.dumps(errors))
+        buffer.seek(0)
+        
+        return send_file(buffer, mimetype='application/zip', as_attachment=True, download_name='thumbnails.zip')
+        
+    except Exception as e:
+        logger.error(f"Batch API error: {type(e).__name__}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint (no auth required)"""
     return jsonify({
         'status': 'healthy',
         'service': 'thumbnail-generator',
-        'auth': 'enabled' if API_KEY else 'disabled'
+        'auth': 'enabled' if API_KEY else 'disabled',
+        'libjpeg_turbo': JPEG_TURBO
     }), 200
 
 
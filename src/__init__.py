@@ -15,74 +15,82 @@ __version__ = "2.0.0"
 __author__ = "Elite 8 Team"
 __phase__ = "Phase 2"
 
-# Core modules - Phase 1
-from .api import a2e_client
-from .database import (
-    DatabaseManager,
-    JobStatus,
-    PostStatus,
-    Platform,
-    get_db,
-    init_sample_data
-)
-from .scheduler import (
-    JobScheduler,
-    ContentScheduler,
-    ScheduleType,
-    get_scheduler,
-    get_content_scheduler
-)
-from .social import (
-    SocialMediaManager,
-    PlatformType,
-    PostResult,
-    EngagementMetrics,
-    ProxyManager,
-    check_proxy_status,
-    quick_post_all,
-    TikTokClient,
-    InstagramClient,
-    YouTubeClient
-)
+import importlib
 
-# Monitoring modules - Phase 1 & 2
-from .monitoring import (
-    ProductionMonitor,
-    TelegramBot,
-    MetricsCollector,
-    AlertSystem,
-    Dashboard,
-    create_production_monitor,
-    create_telegram_bot,
-    create_metrics_collector,
-    create_alert_system,
-    create_dashboard
-)
+# Public names -> (submodule, attribute). Submodules are imported on first
+# attribute access (PEP 562), so `import src` does not pull in Flask, DB
+# drivers, telegram, etc. An attribute of None means the submodule itself.
+_LAZY = {
+    # Core modules - Phase 1
+    'a2e_client': ('api.a2e_client', None),
+    'DatabaseManager': ('database', 'DatabaseManager'),
+    'JobStatus': ('database', 'JobStatus'),
+    'PostStatus': ('database', 'PostStatus'),
+    'Platform': ('database', 'Platform'),
+    'get_db': ('database', 'get_db'),
+    'init_sample_data': ('database', 'init_sample_data'),
+    'JobScheduler': ('scheduler', 'JobScheduler'),
+    'ContentScheduler': ('scheduler', 'ContentScheduler'),
+    'ScheduleType': ('scheduler', 'ScheduleType'),
+    'get_scheduler': ('scheduler', 'get_scheduler'),
+    'get_content_scheduler': ('scheduler', 'get_content_scheduler'),
+    'SocialMediaManager': ('social', 'SocialMediaManager'),
+    'PlatformType': ('social', 'PlatformType'),
+    'PostResult': ('social', 'PostResult'),
+    'EngagementMetrics': ('social', 'EngagementMetrics'),
+    'ProxyManager': ('social', 'ProxyManager'),
+    'check_proxy_status': ('social', 'check_proxy_status'),
+    'quick_post_all': ('social', 'quick_post_all'),
+    'TikTokClient': ('social', 'TikTokClient'),
+    'InstagramClient': ('social', 'InstagramClient'),
+    'YouTubeClient': ('social', 'YouTubeClient'),
+    # Monitoring modules - Phase 1 & 2
+    'ProductionMonitor': ('monitoring', 'ProductionMonitor'),
+    'TelegramBot': ('monitoring', 'TelegramBot'),
+    'MetricsCollector': ('monitoring', 'MetricsCollector'),
+    'AlertSystem': ('monitoring', 'AlertSystem'),
+    'Dashboard': ('monitoring', 'Dashboard'),
+    'create_production_monitor': ('monitoring', 'create_production_monitor'),
+    'create_telegram_bot': ('monitoring', 'create_telegram_bot'),
+    'create_metrics_collector': ('monitoring', 'create_metrics_collector'),
+    'create_alert_system': ('monitoring', 'create_alert_system'),
+    'create_dashboard': ('monitoring', 'create_dashboard'),
+    # Marketing modules - Phase 2
+    'ConversionFunnel': ('marketing', 'ConversionFunnel'),
+    'FunnelStage': ('marketing', 'FunnelStage'),
+    'ContentCategory': ('marketing', 'ContentCategory'),
+    'PlatformTarget': ('marketing', 'PlatformTarget'),
+    'RegionalManager': ('marketing', 'RegionalManager'),
+    'RegionalStrategy': ('marketing', 'RegionalStrategy'),
+    'CountryConfig': ('marketing', 'CountryConfig'),
+    'Region': ('marketing', 'Region'),
+    'Language': ('marketing', 'Language'),
+    'create_conversion_funnel': ('marketing', 'create_conversion_funnel'),
+    'create_regional_manager': ('marketing', 'create_regional_manager'),
+    # Subscriber management - Phase 2 (for premium platforms)
+    'SubscriberManager': ('subscribers', 'SubscriberManager'),
+    'SubscriptionTier': ('subscribers', 'SubscriptionTier'),
+    'SubscriptionStatus': ('subscribers', 'SubscriptionStatus'),
+    'SubscriberPlatform': ('subscribers', 'Platform'),
+    'DatabaseConnection': ('subscribers', 'DatabaseConnection'),
+    'create_subscriber_manager': ('subscribers', 'create_subscriber_manager'),
+}
 
-# Marketing modules - Phase 2
-from .marketing import (
-    ConversionFunnel,
-    FunnelStage,
-    ContentCategory,
-    PlatformTarget,
-    RegionalManager,
-    RegionalStrategy,
-    CountryConfig,
-    Region,
-    Language,
-    create_conversion_funnel,
-    create_regional_manager
-)
 
-# Subscriber management - Phase 2 (for premium platforms)
-from .subscribers import (
-    SubscriberManager,
-    SubscriptionTier,
-    SubscriptionStatus,
-    Platform as SubscriberPlatform,
-    DatabaseConnection,
-    create_subscriber_manager
-)
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module('.' + module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Version and metadata
@@ -8,19 +8,33 @@ supporting authentication, video generation, credit management, and robust error
 import os
 import json
 import time
+import random
 import asyncio
 import aiohttp
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Deque
+from collections import deque
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 import hashlib
 import hmac
 import secrets
 
+try:
+    import orjson
+except ImportError:
+    # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    # Optional: C ISO-8601 parser; datetime.fromisoformat otherwise
+    _parse_dt = datetime.fromisoformat
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -63,7 +77,7 @@ class GenerationStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class A2ECredits:
     """Credit information for A2E account"""
     total_credits: int
@@ -80,7 +94,7 @@ class A2ECredits:
         return (self.used_credits / self.total_credits) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationConfig:
     """Configuration for video generation"""
     model: A2EModelType
@@ -100,24 +114,40 @@ class GenerationConfig:
     priority: str = "normal"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class GenerationJob:
     """Video generation job information"""
     job_id: str
     status: GenerationStatus
     config: GenerationConfig
-    created_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_at: float  # Unix timestamps (time.time()); see the *_dt properties
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
     progress: int = 0
     output_url: Optional[str] = None
     error_message: Optional[str] = None
     credits_used: int = 0
     face_consistency_score: Optional[float] = None
     quality_score: Optional[int] = None
+    eta_seconds: Optional[float] = None
+
+    @property
+    def created_at_dt(self) -> datetime:
+        """created_at as a local datetime"""
+        return datetime.fromtimestamp(self.created_at)
 
+    @property
+    def started_at_dt(self) -> Optional[datetime]:
+        """started_at as a local datetime (None if not started)"""
+        return datetime.fromtimestamp(self.started_at) if self.started_at is not None else None
 
-@dataclass
+    @property
+    def completed_at_dt(self) -> Optional[datetime]:
+        """completed_at as a local datetime (None if not finished)"""
+        return datetime.fromtimestamp(self.completed_at) if self.completed_at is not None else None
+
+
+@dataclass(slots=True)
 class GenerationResult:
     """Result of a generation operation"""
     success: bool
@@ -128,59 +158,134 @@ class GenerationResult:
 
 
 class RateLimiter:
-    """Rate limiter for API requests"""
+    """Token-bucket rate limiter for API requests"""
     
     def __init__(self, requests_per_minute: int = 60, burst_limit: int = 10):
+        if requests_per_minute <= 0 or burst_limit <= 0:
+            raise ValueError("requests_per_minute and burst_limit must be positive")
         self.requests_per_minute = requests_per_minute
         self.burst_limit = burst_limit
-        self.requests: List[float] = []
+        # Bucket holds up to burst_limit tokens and refills at the sustained
+        # rate; one token per request (monotonic clock)
+        self.rate = requests_per_minute / 60.0
+        self.tokens = float(burst_limit)
+        self.updated = time.monotonic()
         self.lock = asyncio.Lock()
     
-    async def acquire(self) -> bool:
-        """Acquire permission to make a request"""
-        async with self.lock:
-            now = time.time()
-            minute_ago = now - 60
-            
-            # Remove old requests from tracking
-            self.requests = [t for t in self.requests if t > minute_ago]
+    async def acquire(self, tokens: float = 1) -> bool:
+        """
+        Acquire permission to make a request
+        
+        The lock only covers refilling and taking tokens; waiting happens
+        outside it, so callers blocked on an empty bucket sleep in parallel
+        instead of queueing behind one sleeper, and re-check when they wake.
+        
+        Args:
+            tokens: Number of tokens this request costs
             
-            # Check if we're at the rate limit
-            if len(self.requests) >= self.requests_per_minute:
-                wait_time = self.requests[0] - minute_ago + 1
-                await asyncio.sleep(wait_time)
-                return await self.acquire()
+        Returns:
+            True once the tokens have been taken
             
-            # Check burst limit
-            recent_requests = [t for t in self.requests if t > now - 10]
-            if len(recent_requests) >= self.burst_limit:
-                wait_time = 10 - (now - recent_requests[0])
-                await asyncio.sleep(max(0, wait_time))
+        Raises:
+            ValueError: If tokens is not in (0, burst_limit]; the bucket never
+                holds more than burst_limit, so such a request could never pass
+        """
+        if not 0 < tokens <= self.burst_limit:
+            raise ValueError(f"tokens must be in (0, {self.burst_limit}], got {tokens}")
+        
+        while True:
+            async with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst_limit, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return True
+                
+                # Sleep until enough tokens have dripped back in
+                wait_time = (tokens - self.tokens) / self.rate
             
-            # Record this request
-            self.requests.append(now)
-            return True
+            await asyncio.sleep(wait_time)
+
+
+# Performance note: credit bookkeeping below is a handful of scalar dict
+# lookups and additions per job, and every caller then waits seconds on the
+# A2E API. JIT/vectorization (Numba, NumPy, GPU) would only add start-up
+# cost here; the wins are in concurrency (session reuse, semaphore, batched
+# status checks) and in not recomputing config-derived values per call.
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a JSON config once per (path, mtime); shared by all CreditManagers"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 
 class CreditManager:
     """Manages credit allocation and tracking based on optimization config"""
     
+    # Config section holding each model's credit table
+    MODEL_CONFIG_KEYS = {
+        A2EModelType.SEEDANCE_1_5_PRO: "primary_model",
+        A2EModelType.WAN_2_5: "secondary_model",
+        A2EModelType.WAN_2_5_720P: "premium_slots_model",
+        A2EModelType.WAN_2_5_480P: "secondary_model",
+        A2EModelType.SEEDANCE_1_5_PRO_1080P: "premium_slots_model",
+    }
+    
+    # Durations precomputed into the credit lookup table
+    TABLE_DURATIONS = (5, 10, 15, 30)
+    
     def __init__(self, config_path: str):
         self.config_path = config_path
+        self._config_mtime: Optional[float] = None
+        self._cached_keys: Tuple[str, str] = ("", "")
+        self._cached_keys_expiry = 0.0
         self.config = self._load_config()
+        self._build_lookup_tables()
         self.daily_usage: Dict[str, int] = {}
         self.monthly_usage: Dict[str, int] = {}
         self._initialize_tracking()
     
+    def _stat_config(self) -> Optional[float]:
+        """Modification time of the config file, or None if it is missing"""
+        try:
+            return os.stat(self.config_path).st_mtime
+        except OSError:
+            return None
+    
     def _load_config(self) -> Dict[str, Any]:
-        """Load the optimization configuration"""
+        """Load the optimization configuration (parsed once per file version)"""
+        self._config_mtime = self._stat_config()
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            if self._config_mtime is None:
+                raise FileNotFoundError(self.config_path)
+            return _load_config_cached(self.config_path, self._config_mtime)
         except FileNotFoundError:
             logger.warning(f"Config file not found at {self.config_path}, using defaults")
             return self._get_default_config()
     
+    def _maybe_reload(self):
+        """Reload the config and lookup tables if the file changed on disk"""
+        if self._stat_config() != self._config_mtime:
+            self.config = self._load_config()
+            self._build_lookup_tables()
+    
+    def _build_lookup_tables(self):
+        """Resolve per-model credits and allocation totals from the config once"""
+        self._model_credit_table: Dict[Tuple[A2EModelType, int], int] = {
+            (model, duration): self._resolve_credits(model, duration)
+            for model in A2EModelType
+            for duration in self.TABLE_DURATIONS
+        }
+        self._daily_alloc: int = self.config.get("daily_credit_allocation", {}).get("reels_allocation", 255)
+        self._monthly_total: int = self.config.get("monthly_credits_available", 3600)
+        # usage * divisor == percentage (0 when the total is not positive)
+        self._daily_pct_divisor = 100.0 / self._daily_alloc if self._daily_alloc > 0 else 0.0
+        self._monthly_pct_divisor = 100.0 / self._monthly_total if self._monthly_total > 0 else 0.0
+    
     def _get_default_config(self) -> Dict[str, Any]:
         """Return default configuration if file not found"""
         return {
@@ -194,10 +299,25 @@ class CreditManager:
             }
         }
     
+    def _today_keys(self) -> Tuple[str, str]:
+        """
+        Return the (day, month) usage keys, e.g. ("2026-01-22", "2026-01")
+        
+        The strings are formatted at most once a minute and the cache never
+        outlives the current day.
+        """
+        now_mono = time.monotonic()
+        if now_mono >= self._cached_keys_expiry:
+            now = datetime.now()
+            day = now.strftime("%Y-%m-%d")
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            self._cached_keys = (day, day[:7])
+            self._cached_keys_expiry = now_mono + min(60.0, (midnight - now).total_seconds())
+        return self._cached_keys
+    
     def _initialize_tracking(self):
         """Initialize daily and monthly usage tracking"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        month_key = datetime.now().strftime("%Y-%m")
+        today, month_key = self._today_keys()
         
         if today not in self.daily_usage:
             self.daily_usage[today] = 0
@@ -206,17 +326,17 @@ class CreditManager:
     
     def get_credits_for_model(self, model: A2EModelType, duration: int) -> int:
         """Calculate credits required for a specific model and duration"""
+        self._maybe_reload()
+        credits = self._model_credit_table.get((model, duration))
+        if credits is None:
+            credits = self._resolve_credits(model, duration)
+        return credits
+    
+    def _resolve_credits(self, model: A2EModelType, duration: int) -> int:
+        """Walk the config for a model/duration's credit cost"""
         model_config = self.config.get("model_optimization", {})
         
-        model_mapping = {
-            A2EModelType.SEEDANCE_1_5_PRO: "primary_model",
-            A2EModelType.WAN_2_5: "secondary_model",
-            A2EModelType.WAN_2_5_720P: "premium_slots_model",
-            A2EModelType.WAN_2_5_480P: "secondary_model",
-            A2EModelType.SEEDANCE_1_5_PRO_1080P: "premium_slots_model",
-        }
-        
-        config_key = model_mapping.get(model, "primary_model")
+        config_key = self.MODEL_CONFIG_KEYS.get(model, "primary_model")
         model_data = model_config.get(config_key, {})
         
         if not model_data:
@@ -230,8 +350,9 @@ class CreditManager:
     
     def check_credit_availability(self, required_credits: int) -> Tuple[bool, int]:
         """Check if enough credits are available"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        daily_allocation = self.config.get("daily_credit_allocation", {}).get("reels_allocation", 255)
+        self._maybe_reload()
+        today, month_key = self._today_keys()
+        daily_allocation = self._daily_alloc
         
         current_usage = self.daily_usage.get(today, 0)
         available = daily_allocation - current_usage
@@ -240,9 +361,8 @@ class CreditManager:
             return True, available
         
         # Check monthly buffer
-        month_key = datetime.now().strftime("%Y-%m")
         monthly_used = self.monthly_usage.get(month_key, 0)
-        monthly_total = self.config.get("monthly_credits_available", 3600)
+        monthly_total = self._monthly_total
         monthly_available = monthly_total - monthly_used
         
         if monthly_available >= required_credits:
@@ -252,8 +372,7 @@ class CreditManager:
     
     def allocate_credits(self, credits_used: int, job_id: str):
         """Record credit allocation for tracking"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        month_key = datetime.now().strftime("%Y-%m")
+        today, month_key = self._today_keys()
         
         if today not in self.daily_usage:
             self.daily_usage[today] = 0
@@ -267,22 +386,22 @@ class CreditManager:
     
     def get_usage_report(self) -> Dict[str, Any]:
         """Get current usage report"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        month_key = datetime.now().strftime("%Y-%m")
+        self._maybe_reload()
+        today, month_key = self._today_keys()
         
-        daily_total = self.config.get("daily_credit_allocation", {}).get("reels_allocation", 255)
-        monthly_total = self.config.get("monthly_credits_available", 3600)
+        daily_used = self.daily_usage.get(today, 0)
+        monthly_used = self.monthly_usage.get(month_key, 0)
         
         return {
             "daily": {
-                "used": self.daily_usage.get(today, 0),
-                "total": daily_total,
-                "percentage": (self.daily_usage.get(today, 0) / daily_total) * 100 if daily_total > 0 else 0
+                "used": daily_used,
+                "total": self._daily_alloc,
+                "percentage": daily_used * self._daily_pct_divisor
             },
             "monthly": {
-                "used": self.monthly_usage.get(month_key, 0),
-                "total": monthly_total,
-                "percentage": (self.monthly_usage.get(month_key, 0) / monthly_total) * 100 if monthly_total > 0 else 0
+                "used": monthly_used,
+                "total": self._monthly_total,
+                "percentage": monthly_used * self._monthly_pct_divisor
             },
             "report_time": datetime.now().isoformat()
         }
@@ -307,6 +426,31 @@ class A2EApiError(Exception):
         return base
 
 
+def _json_dumps(obj: Any) -> str:
+    """JSON encoder for request bodies (orjson when installed)"""
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+
+# Config attached to jobs this client did not submit (their real settings are
+# unknown); built once and shared by every such job, so treat it as read-only
+_PLACEHOLDER_CONFIG = GenerationConfig(
+    model=A2EModelType.SEEDANCE_1_5_PRO,
+    resolution=VideoResolution.HD_720P,
+    duration_seconds=15,
+    prompt=""
+)
+
+
+# API job status string -> GenerationStatus
+STATUS_MAP = {
+    "queued": GenerationStatus.QUEUED,
+    "processing": GenerationStatus.PROCESSING,
+    "completed": GenerationStatus.COMPLETED,
+    "failed": GenerationStatus.FAILED,
+    "cancelled": GenerationStatus.CANCELLED
+}
+
+
 class A2EClient:
     """
     Main client for interacting with a2e.ai API
@@ -332,12 +476,21 @@ class A2EClient:
         A2EModelType.WAN_2_6: "/generate/wan-2.6",
     }
     
-    def __init__(self, config_path: str = None):
+    def __init__(
+        self,
+        config_path: str = None,
+        max_concurrent_requests: int = 20,
+        completed_jobs_limit: int = 1000
+    ):
         """
         Initialize the A2E API client
         
         Args:
             config_path: Path to the optimization configuration file
+            max_concurrent_requests: Cap on in-flight API requests (also the
+                per-host connection limit); tune alongside the rate limiter
+            completed_jobs_limit: How many finished jobs to keep in
+                completed_jobs (oldest are dropped first)
         """
         # Load API key from environment
         self.api_key = os.getenv("A2E_API_KEY")
@@ -357,63 +510,112 @@ class A2EClient:
             )
         self.config_path = config_path
         
+        # Constant authentication headers, built once and set on the session;
+        # only the timestamp/nonce are generated per request
+        self._static_headers: Dict[str, str] = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "X-API-Key": self.api_key,
+            "X-Client-Version": "2.0.0",
+            "X-Platform": "elite-8-system"
+        }
+        
+        # Full request URLs, built once instead of concatenated per call
+        self._model_urls = {m: f"{self.BASE_URL}{ep}" for m, ep in self.MODEL_ENDPOINTS.items()}
+        self._default_model_url = self._model_urls[A2EModelType.SEEDANCE_1_5_PRO]
+        self._job_url_tmpl = f"{self.BASE_URL}/jobs/{{}}"
+        self._urls = {
+            "credits": f"{self.BASE_URL}/account/credits",
+            "usage": f"{self.BASE_URL}/account/usage",
+            "jobs": f"{self.BASE_URL}/jobs",
+            "jobs_batch": f"{self.BASE_URL}/jobs/batch",
+            "models": f"{self.BASE_URL}/models",
+            "health": f"{self.BASE_URL}/health",
+        }
+        
         # Initialize components
         self.credit_manager = CreditManager(config_path)
         self.rate_limiter = RateLimiter(requests_per_minute=60, burst_limit=10)
         
         # Session for HTTP requests
         self._session: Optional[aiohttp.ClientSession] = None
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
         
         # Job tracking
         self.active_jobs: Dict[str, GenerationJob] = {}
-        self.completed_jobs: List[GenerationJob] = []
+        self.completed_jobs: Deque[GenerationJob] = deque(maxlen=completed_jobs_limit)
         
         # Retry configuration
         self.max_retries = 3
         self.retry_delay = 5  # seconds
         self.retry_backoff = 2  # exponential backoff multiplier
         
-        # Circuit breaker for API failures
+        # Circuit breaker for API failures: opens after `threshold` consecutive
+        # failures, goes half-open (one trial call) once the break elapses, and
+        # each failed trial lengthens the break by `backoff_factor`
         self._circuit_breaker_trips = 0
         self._circuit_breaker_threshold = 5
         self._circuit_breaker_reset_time = 300  # 5 minutes
-        self._last_failure_time: Optional[datetime] = None
+        self._circuit_breaker_backoff_factor = 2
+        self._circuit_breaker_max_reset_time = 3600
+        self._circuit_reset_timeout = self._circuit_breaker_reset_time
+        self._circuit_open_until = 0.0  # time.monotonic() the break ends, 0 = closed
+        self._circuit_trial_in_flight = False
+        
+        # Whether POST /jobs/batch exists (cleared on the first 404)
+        self._batch_status_supported = True
         
         logger.info("A2E API Client initialized successfully")
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
+    async def connect(self) -> aiohttp.ClientSession:
+        """
+        Create the long-lived HTTP session (idempotent)
+        
+        One session and one bounded connector are reused for every request,
+        so DNS lookups and TLS handshakes are paid once per pooled connection
+        rather than once per call.
+        
+        Returns:
+            The shared aiohttp.ClientSession
+        """
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=300, connect=30, sock_read=60, sock_connect=30)
+            connector = aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=self.max_concurrent_requests,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            )
             self._session = aiohttp.ClientSession(
                 timeout=timeout,
-                headers=self._get_headers()
+                connector=connector,
+                headers=self._static_headers,
+                json_serialize=_json_dumps
             )
         return self._session
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Generate authentication headers"""
-        timestamp = str(int(time.time()))
-        nonce = secrets.token_hex(8)
-        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            return await self.connect()
+        return self._session
+    
+    def _request_headers(self) -> Dict[str, str]:
+        """Per-request headers: a fresh timestamp and nonce for every call"""
         return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-            "X-Timestamp": timestamp,
-            "X-Nonce": nonce,
-            "X-Client-Version": "2.0.0",
-            "X-Platform": "elite-8-system"
+            "X-Timestamp": str(int(time.time())),
+            "X-Nonce": secrets.token_hex(8)
         }
     
     async def _make_request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         data: Dict = None,
         files: Dict = None
     ) -> Dict[str, Any]:
-        """Make an API request with error handling"""
+        """Make an API request (to a full, precomputed URL) with error handling"""
         
         # Check circuit breaker
         if self._is_circuit_broken():
@@ -423,52 +625,82 @@ class A2EClient:
                 retryable=True
             )
         
-        # Apply rate limiting
-        await self.rate_limiter.acquire()
-        
-        session = await self._get_session()
-        url = f"{self.BASE_URL}{endpoint}"
-        
-        logger.debug(f"Making {method} request to {url}")
+        method = method.upper()
+        if method not in ("GET", "POST", "DELETE"):
+            raise A2EApiError(f"Unsupported HTTP method: {method}")
         
+        # Past the break: this call is the single half-open trial
+        trial = bool(self._circuit_open_until)
+        if trial:
+            self._circuit_trial_in_flight = True
         try:
-            if method.upper() == "GET":
-                async with session.get(url, params=data) as response:
-                    return await self._handle_response(response)
-            elif method.upper() == "POST":
-                if files:
-                    form = aiohttp.FormData()
-                    for key, value in files.items():
-                        form.add_field(key, value)
-                    if data:
-                        for key, value in data.items():
-                            form.add_field(key, str(value))
-                    async with session.post(url, data=form) as response:
-                        return await self._handle_response(response)
-                else:
-                    async with session.post(url, json=data) as response:
-                        return await self._handle_response(response)
-            elif method.upper() == "DELETE":
-                async with session.delete(url, json=data) as response:
-                    return await self._handle_response(response)
+            return await self._send_request(method, url, data, files, trial)
+        finally:
+            if trial:
+                self._circuit_trial_in_flight = False
+    
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict],
+        files: Optional[Dict],
+        trial: bool
+    ) -> Dict[str, Any]:
+        """Send one request and feed its outcome to the circuit breaker"""
+        # Bound in-flight requests before they queue up inside aiohttp
+        async with self._request_semaphore:
+            # Apply rate limiting
+            await self.rate_limiter.acquire()
+            
+            session = await self._get_session()
+            headers = self._request_headers()
+            
+            logger.debug(f"Making {method} request to {url}")
+            
+            if method == "GET":
+                body = {"params": data}
+            elif method == "POST" and files:
+                form = aiohttp.FormData()
+                for key, value in files.items():
+                    form.add_field(key, value)
+                if data:
+                    for key, value in data.items():
+                        form.add_field(key, str(value))
+                body = {"data": form}
             else:
-                raise A2EApiError(f"Unsupported HTTP method: {method}")
-        
-        except aiohttp.ClientError as e:
-            self._record_failure()
-            raise A2EApiError(
-                f"Network error: {str(e)}",
-                error_code="NETWORK_ERROR",
-                retryable=True
-            )
+                body = {"json": data}
+            
+            try:
+                async with session.request(method, url, headers=headers, **body) as response:
+                    result = await self._handle_response(response)
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._record_failure(trial)
+                raise A2EApiError(
+                    f"Network error: {str(e) or type(e).__name__}",
+                    error_code="NETWORK_ERROR",
+                    retryable=True
+                )
+            except A2EApiError as e:
+                # 5xx means the backend is failing; any other error means it answered
+                if e.status_code is not None and e.status_code >= 500:
+                    self._record_failure(trial)
+                else:
+                    self._record_success()
+                raise
+            
+            self._record_success()
+            return result
     
     async def _handle_response(self, response: aiohttp.ClientResponse) -> Dict[str, Any]:
         """Handle API response and raise appropriate errors"""
         status = response.status
+        body = await response.read()
         try:
-            data = await response.json()
-        except Exception:
-            data = {"message": await response.text()}
+            data = orjson.loads(body) if orjson else json.loads(body)
+        except ValueError:
+            data = {"message": body.decode(response.charset or "utf-8", errors="replace")}
         
         if status == 200:
             return data
@@ -501,7 +733,6 @@ class A2EClient:
                 retryable=True
             )
         elif status >= 500:
-            self._record_failure()
             raise A2EApiError(
                 data.get("message", "Server error"),
                 status_code=status,
@@ -517,42 +748,68 @@ class A2EClient:
             )
     
     def _is_circuit_broken(self) -> bool:
-        """Check if circuit breaker is active"""
-        if self._last_failure_time is None:
+        """Check if circuit breaker is active (open, or half-open with its trial in flight)"""
+        if not self._circuit_open_until:
             return False
-        
-        elapsed = (datetime.now() - self._last_failure_time).total_seconds()
-        if elapsed > self._circuit_breaker_reset_time:
-            self._circuit_breaker_trips = 0
-            self._last_failure_time = None
-            return False
-        
-        return self._circuit_breaker_trips >= self._circuit_breaker_threshold
+        return self._circuit_trial_in_flight or time.monotonic() < self._circuit_open_until
     
-    def _record_failure(self):
+    def _circuit_state(self) -> str:
+        """Circuit breaker state: closed, open or half_open"""
+        if not self._circuit_open_until:
+            return "closed"
+        return "open" if self._is_circuit_broken() else "half_open"
+    
+    def _record_failure(self, trial: bool = False):
         """Record an API failure for circuit breaker"""
         self._circuit_breaker_trips += 1
-        self._last_failure_time = datetime.now()
         
-        if self._circuit_breaker_trips >= self._circuit_breaker_threshold:
-            logger.warning(f"Circuit breaker tripped after {self._circuit_breaker_trips} failures")
+        if trial:
+            # Failed half-open trial: break again, for longer
+            self._circuit_reset_timeout = min(
+                self._circuit_reset_timeout * self._circuit_breaker_backoff_factor,
+                self._circuit_breaker_max_reset_time
+            )
+        elif self._circuit_breaker_trips < self._circuit_breaker_threshold:
+            return
+        
+        self._circuit_open_until = time.monotonic() + self._circuit_reset_timeout
+        logger.warning(
+            f"Circuit breaker tripped after {self._circuit_breaker_trips} failures, "
+            f"open for {self._circuit_reset_timeout}s"
+        )
+    
+    def _record_success(self):
+        """Record an API success; closes the circuit breaker"""
+        if self._circuit_open_until:
+            logger.info("Circuit breaker closed after successful trial request")
+        self._circuit_breaker_trips = 0
+        self._circuit_reset_timeout = self._circuit_breaker_reset_time
+        self._circuit_open_until = 0.0
     
     def _reset_circuit_breaker(self):
         """Manually reset the circuit breaker"""
         self._circuit_breaker_trips = 0
-        self._last_failure_time = None
+        self._circuit_reset_timeout = self._circuit_breaker_reset_time
+        self._circuit_open_until = 0.0
         logger.info("Circuit breaker reset")
     
-    async def _retry_with_backoff(self, func, *args, **kwargs):
-        """Execute a function with exponential backoff retry"""
-        last_exception = None
+    async def _retry_with_backoff(self, coro_factory, *args, **kwargs):
+        """
+        Execute a request with exponential backoff retry
         
+        Args:
+            coro_factory: Async function called afresh on every attempt (a
+                coroutine object can only be awaited once)
+            
+        Returns:
+            Whatever coro_factory's coroutine returns
+        """
         for attempt in range(self.max_retries):
             try:
-                return await func(*args, **kwargs)
+                return await coro_factory(*args, **kwargs)
             except A2EApiError as e:
-                last_exception = e
-                if not e.retryable:
+                # An open breaker fails fast; sleeping through retries won't close it
+                if not e.retryable or e.error_code == "CIRCUIT_BROKEN":
                     raise
                 
                 if attempt < self.max_retries - 1:
@@ -575,9 +832,8 @@ class A2EClient:
         """
         logger.info("Fetching credit balance")
         
-        def _fetch_credits():
-            response = self._make_request("GET", "/account/credits")
-            return response
+        async def _fetch_credits():
+            return await self._make_request("GET", self._urls["credits"])
         
         data = await self._retry_with_backoff(_fetch_credits)
         
@@ -601,8 +857,8 @@ class A2EClient:
         """Get credit usage history for specified days"""
         logger.info(f"Fetching credit usage history for {days} days")
         
-        def _fetch_history():
-            return self._make_request("GET", "/account/usage", {"days": days})
+        async def _fetch_history():
+            return await self._make_request("GET", self._urls["usage"], {"days": days})
         
         data = await self._retry_with_backoff(_fetch_history)
         return data.get("usage", [])
@@ -636,10 +892,10 @@ class A2EClient:
         payload = self._build_generation_payload(config)
         
         # Make the API call
-        def _submit_generation():
-            return self._make_request(
+        async def _submit_generation():
+            return await self._make_request(
                 "POST",
-                self.MODEL_ENDPOINTS.get(config.model, "/generate/seedance"),
+                self._model_urls.get(config.model, self._default_model_url),
                 data=payload
             )
         
@@ -653,7 +909,7 @@ class A2EClient:
                 job_id=job_id,
                 status=GenerationStatus.QUEUED,
                 config=config,
-                created_at=datetime.now(),
+                created_at=time.time(),
                 credits_used=required_credits
             )
             
@@ -731,11 +987,56 @@ class A2EClient:
         """
         logger.debug(f"Checking status for job {job_id}")
         
-        def _check_status():
-            return self._make_request("GET", f"/jobs/{job_id}")
+        async def _check_status():
+            return await self._make_request("GET", self._job_url_tmpl.format(job_id))
         
         data = await self._retry_with_backoff(_check_status)
+        return self._apply_job_status(job_id, data)
+    
+    async def get_job_statuses(self, job_ids: List[str]) -> List[GenerationJob]:
+        """
+        Get the status of several generation jobs at once
+        
+        Uses the API's batch endpoint (one request) when it exists, and
+        otherwise checks the jobs concurrently; in-flight requests stay
+        bounded by the client's request semaphore either way.
         
+        Args:
+            job_ids: The job IDs to check
+            
+        Returns:
+            GenerationJob list in the same order as job_ids
+        """
+        if not job_ids:
+            return []
+        
+        # Each distinct job is fetched and applied once; duplicates share the result
+        unique_ids = list(dict.fromkeys(job_ids))
+        
+        if self._batch_status_supported:
+            async def _check_batch():
+                return await self._make_request("POST", self._urls["jobs_batch"], {"ids": unique_ids})
+            
+            try:
+                data = await self._retry_with_backoff(_check_batch)
+            except A2EApiError as e:
+                if e.status_code != 404:
+                    raise
+                logger.info("Batch job status endpoint not available, checking jobs individually")
+                self._batch_status_supported = False
+            else:
+                by_id = {d.get("job_id", d.get("id")): d for d in data.get("jobs", [])}
+                jobs = {j: self._apply_job_status(j, by_id[j]) for j in unique_ids if j in by_id}
+                missing = [j for j in unique_ids if j not in jobs]
+                if missing:
+                    jobs.update(zip(missing, await asyncio.gather(*(self.get_job_status(j) for j in missing))))
+                return [jobs[j] for j in job_ids]
+        
+        jobs = dict(zip(unique_ids, await asyncio.gather(*(self.get_job_status(j) for j in unique_ids))))
+        return [jobs[j] for j in job_ids]
+    
+    def _apply_job_status(self, job_id: str, data: Dict[str, Any]) -> GenerationJob:
+        """Apply an API status payload to the tracked (or a placeholder) job"""
         # Update existing job or create new one
         if job_id in self.active_jobs:
             job = self.active_jobs[job_id]
@@ -744,30 +1045,18 @@ class A2EClient:
             job = GenerationJob(
                 job_id=job_id,
                 status=GenerationStatus.QUEUED,
-                config=GenerationConfig(
-                    model=A2EModelType.SEEDANCE_1_5_PRO,
-                    resolution=VideoResolution.HD_720P,
-                    duration_seconds=15,
-                    prompt=""
-                ),
-                created_at=datetime.now()
+                config=_PLACEHOLDER_CONFIG,
+                created_at=time.time()
             )
         
         # Update job status
-        status_map = {
-            "queued": GenerationStatus.QUEUED,
-            "processing": GenerationStatus.PROCESSING,
-            "completed": GenerationStatus.COMPLETED,
-            "failed": GenerationStatus.FAILED,
-            "cancelled": GenerationStatus.CANCELLED
-        }
-        
         api_status = data.get("status", "queued")
-        job.status = status_map.get(api_status, GenerationStatus.QUEUED)
+        job.status = STATUS_MAP.get(api_status, GenerationStatus.QUEUED)
         job.progress = data.get("progress", 0)
+        job.eta_seconds = data.get("progress_estimate_seconds", data.get("eta_seconds"))
         
         if job.status == GenerationStatus.COMPLETED:
-            job.completed_at = datetime.now()
+            job.completed_at = time.time()
             job.output_url = data.get("output_url", data.get("video_url"))
             job.face_consistency_score = data.get("face_consistency_score")
             job.quality_score = data.get("quality_score")
@@ -779,7 +1068,7 @@ class A2EClient:
             logger.info(f"Job {job_id} completed with quality score: {job.quality_score}")
         
         elif job.status == GenerationStatus.FAILED:
-            job.completed_at = datetime.now()
+            job.completed_at = time.time()
             job.error_message = data.get("error_message", data.get("error", "Unknown error"))
             
             # Move to completed
@@ -789,38 +1078,57 @@ class A2EClient:
             logger.error(f"Job {job_id} failed: {job.error_message}")
         
         elif job.status == GenerationStatus.PROCESSING:
-            job.started_at = job.started_at or datetime.now()
+            job.started_at = job.started_at or time.time()
         
         return job
     
     async def wait_for_completion(
         self,
         job_id: str,
-        poll_interval: int = 10,
+        poll_interval: int = 30,
         max_wait: int = 600
     ) -> GenerationJob:
         """
         Wait for a generation job to complete
         
+        Status checks start 1s apart and back off by 1.5x up to
+        poll_interval, so short jobs return quickly while long jobs cost
+        few requests. The interval only grows while the job's progress is
+        flat, and each sleep gets +/-20% jitter so many concurrent waiters
+        do not poll in lockstep. When the status payload carries a
+        completion estimate, the next check is aimed at it instead.
+        
         Args:
             job_id: The job ID to wait for
-            poll_interval: Seconds between status checks
+            poll_interval: Maximum seconds between status checks
             max_wait: Maximum seconds to wait
             
         Returns:
             Completed GenerationJob
         """
         logger.info(f"Waiting for job {job_id} to complete")
-        start_time = time.time()
+        deadline = time.monotonic() + max_wait
+        delay = 1.0
+        last_progress = -1
         
-        while time.time() - start_time < max_wait:
+        while time.monotonic() < deadline:
             job = await self.get_job_status(job_id)
             
             if job.status in [GenerationStatus.COMPLETED, GenerationStatus.FAILED, GenerationStatus.CANCELLED]:
                 return job
             
             logger.debug(f"Job {job_id}: {job.status.value} ({job.progress}%)")
-            await asyncio.sleep(poll_interval)
+            base = min(delay, poll_interval)
+            if job.eta_seconds:
+                # Server-side estimate: wake near it, within [1s, poll_interval]
+                base = min(max(float(job.eta_seconds), 1.0), poll_interval)
+            sleep_for = base * random.uniform(0.8, 1.2)
+            await asyncio.sleep(max(0.0, min(sleep_for, deadline - time.monotonic())))
+            
+            # Back off only while the job is not visibly advancing
+            if job.progress <= last_progress:
+                delay = min(delay * 1.5, poll_interval)
+            last_progress = job.progress
         
         raise A2EApiError(
             f"Job {job_id} did not complete within {max_wait} seconds",
@@ -828,6 +1136,44 @@ class A2EClient:
             retryable=False
         )
     
+    async def generate_and_wait_many(
+        self,
+        configs: List[GenerationConfig],
+        poll_interval: int = 30,
+        max_wait: int = 600
+    ) -> List[GenerationResult]:
+        """
+        Submit several generations and wait for all of them concurrently
+        
+        Each config is submitted and polled in its own task, so network
+        waits overlap across jobs; the rate limiter and request semaphore
+        still bound the actual traffic.
+        
+        Args:
+            configs: GenerationConfig per video
+            poll_interval: Maximum seconds between status checks
+            max_wait: Maximum seconds to wait for each job
+            
+        Returns:
+            GenerationResult per config, in the same order
+        """
+        async def _one(config: GenerationConfig) -> GenerationResult:
+            result = await self.generate_video(config)
+            if not (result.success and result.job):
+                return result
+            try:
+                job = await self.wait_for_completion(result.job.job_id, poll_interval, max_wait)
+            except A2EApiError as e:
+                return GenerationResult(
+                    success=False,
+                    job=result.job,
+                    error=e.message,
+                    retry_recommended=e.retryable
+                )
+            return GenerationResult(success=job.status == GenerationStatus.COMPLETED, job=job)
+        
+        return list(await asyncio.gather(*(_one(config) for config in configs)))
+    
     async def cancel_job(self, job_id: str) -> bool:
         """
         Cancel a running generation job
@@ -840,8 +1186,8 @@ class A2EClient:
         """
         logger.info(f"Cancelling job {job_id}")
         
-        def _cancel():
-            return self._make_request("DELETE", f"/jobs/{job_id}")
+        async def _cancel():
+            return await self._make_request("DELETE", self._job_url_tmpl.format(job_id))
         
         try:
             await self._retry_with_backoff(_cancel)
@@ -877,8 +1223,8 @@ class A2EClient:
         if status:
             params["status"] = status.value
         
-        def _list_jobs():
-            return self._make_request("GET", "/jobs", params)
+        async def _list_jobs():
+            return await self._make_request("GET", self._urls["jobs"], params)
         
         data = await self._retry_with_backoff(_list_jobs)
         
@@ -894,26 +1240,20 @@ class A2EClient:
     
     def _job_data_to_job(self, data: Dict) -> GenerationJob:
         """Convert API job data to GenerationJob object"""
-        status_map = {
-            "queued": GenerationStatus.QUEUED,
-            "processing": GenerationStatus.PROCESSING,
-            "completed": GenerationStatus.COMPLETED,
-            "failed": GenerationStatus.FAILED,
-            "cancelled": GenerationStatus.CANCELLED
-        }
-        
         # Parse dates
-        created_at = datetime.fromisoformat(data.get("created_at", datetime.now().isoformat()))
+        created_at = time.time()
+        if data.get("created_at"):
+            created_at = _parse_dt(data["created_at"]).timestamp()
         started_at = None
         if data.get("started_at"):
-            started_at = datetime.fromisoformat(data["started_at"])
+            started_at = _parse_dt(data["started_at"]).timestamp()
         completed_at = None
         if data.get("completed_at"):
-            completed_at = datetime.fromisoformat(data["completed_at"])
+            completed_at = _parse_dt(data["completed_at"]).timestamp()
         
         return GenerationJob(
             job_id=data.get("job_id", data.get("id", "unknown")),
-            status=status_map.get(data.get("status", "queued"), GenerationStatus.QUEUED),
+            status=STATUS_MAP.get(data.get("status", "queued"), GenerationStatus.QUEUED),
             config=GenerationConfig(
                 model=A2EModelType(data.get("model", "seedance_1.5_pro")),
                 resolution=VideoResolution.HD_720P,
@@ -933,8 +1273,8 @@ class A2EClient:
         """Get list of available models and their capabilities"""
         logger.info("Fetching available models")
         
-        def _get_models():
-            return self._make_request("GET", "/models")
+        async def _get_models():
+            return await self._make_request("GET", self._urls["models"])
         
         data = await self._retry_with_backoff(_get_models)
         return data.get("models", [])
@@ -972,30 +1312,33 @@ class A2EClient:
             "timestamp": datetime.now().isoformat()
         }
         
-        try:
-            # Check API reachability
-            def _ping():
-                return self._make_request("GET", "/health")
-            
-            await self._retry_with_backoff(_ping)
+        async def _ping():
+            return await self._make_request("GET", self._urls["health"])
+        
+        # API reachability and credits are checked concurrently
+        ping_result, credits = await asyncio.gather(
+            self._retry_with_backoff(_ping),
+            self.get_credits(),
+            return_exceptions=True
+        )
+        
+        if isinstance(ping_result, BaseException):
+            logger.warning(f"Health check failed: {ping_result}")
+        else:
             health["api_reachable"] = True
-        except Exception as e:
-            logger.warning(f"Health check failed: {e}")
         
-        try:
-            # Check credits
-            credits = await self.get_credits()
+        if isinstance(credits, BaseException):
+            logger.warning(f"Credit check failed: {credits}")
+        else:
             health["credits_available"] = credits.remaining_credits > 0
             health["credit_balance"] = {
                 "total": credits.total_credits,
                 "remaining": credits.remaining_credits,
                 "usage_percentage": credits.usage_percentage
             }
-        except Exception as e:
-            logger.warning(f"Credit check failed: {e}")
         
         # Circuit breaker status
-        health["circuit_breaker"] = "open" if self._is_circuit_broken() else "closed"
+        health["circuit_breaker"] = self._circuit_state()
         
         # Overall status
         if health["api_reachable"] and health["credits_available"]:
@@ -1011,9 +1354,21 @@ class A2EClient:
         """Close the HTTP session"""
         if self._session and not self._session.closed:
             await self._session.close()
+            # Give the connector a moment to close pooled (TLS) transports
+            await asyncio.sleep(0.25)
             self._session = None
             logger.info("A2E API Client session closed")
     
+    async def __aenter__(self):
+        """Async context manager entry: opens the shared session"""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+        return False
+    
     def __enter__(self):
         """Context manager entry"""
         return self
@@ -1034,7 +1389,8 @@ class A2EClient:
 async def quick_generate(
     prompt: str,
     duration: int = 15,
-    model: A2EModelType = A2EModelType.SEEDANCE_1_5_PRO
+    model: A2EModelType = A2EModelType.SEEDANCE_1_5_PRO,
+    client: Optional[A2EClient] = None
 ) -> GenerationResult:
     """
     Quick video generation with default settings
@@ -1043,57 +1399,66 @@ async def quick_generate(
         prompt: The generation prompt
         duration: Video duration in seconds
         model: Model to use
+        client: Open A2EClient to reuse (keeps its pooled connections);
+            a temporary one is created and closed when omitted
         
     Returns:
         GenerationResult
     """
-    config_path = os.getenv(
-        "A2E_CONFIG_PATH",
-        os.getenv("A2E_CONFIG_PATH", "/app/config/avatars/pro_plan_optimized.json")
+    if client is None:
+        config_path = os.getenv("A2E_CONFIG_PATH", "/app/config/avatars/pro_plan_optimized.json")
+        async with A2EClient(config_path=config_path) as client:
+            return await quick_generate(prompt, duration, model, client=client)
+    
+    resolution = VideoResolution.HD_720P
+    if model == A2EModelType.WAN_2_5_480P:
+        resolution = VideoResolution.SD_480P
+    elif model == A2EModelType.SEEDANCE_1_5_PRO_1080P:
+        resolution = VideoResolution.FHD_1080P
+    
+    gen_config = GenerationConfig(
+        model=model,
+        resolution=resolution,
+        duration_seconds=duration,
+        prompt=prompt
     )
     
-    async with A2EClient(config_path=config_path) as client:
-        resolution = VideoResolution.HD_720P
-        if model == A2EModelType.WAN_2_5_480P:
-            resolution = VideoResolution.SD_480P
-        elif model == A2EModelType.SEEDANCE_1_5_PRO_1080P:
-            resolution = VideoResolution.FHD_1080P
-        
-        gen_config = GenerationConfig(
-            model=model,
-            resolution=resolution,
-            duration_seconds=duration,
-            prompt=prompt
-        )
-        
-        result = await client.generate_video(gen_config)
-        
-        if result.success and result.job:
-            final_job = await client.wait_for_completion(result.job.job_id)
-            return GenerationResult(success=final_job.status == GenerationStatus.COMPLETED, job=final_job)
-        
-        return result
+    result = await client.generate_video(gen_config)
+    
+    if result.success and result.job:
+        final_job = await client.wait_for_completion(result.job.job_id)
+        return GenerationResult(success=final_job.status == GenerationStatus.COMPLETED, job=final_job)
+    
+    return result
 
 
-async def check_balance() -> Dict[str, Any]:
-    """Quick check of credit balance"""
-    config_path = os.getenv(
-        "A2E_CONFIG_PATH",
-        os.getenv("A2E_CONFIG_PATH", "/app/config/avatars/pro_plan_optimized.json")
-    )
+async def check_balance(client: Optional[A2EClient] = None) -> Dict[str, Any]:
+    """
+    Quick check of credit balance
     
-    async with A2EClient(config_path=config_path) as client:
-        credits = await client.get_credits()
-        usage = client.credit_manager.get_usage_report()
+    Args:
+        client: Open A2EClient to reuse; a temporary one is created and
+            closed when omitted
         
-        return {
-            "plan": credits.plan_type.value,
-            "total_credits": credits.total_credits,
-            "remaining_credits": credits.remaining_credits,
-            "usage_percentage": round(credits.usage_percentage, 2),
-            "daily_usage": usage["daily"],
-            "monthly_usage": usage["monthly"]
-        }
+    Returns:
+        Plan, credit and usage summary
+    """
+    if client is None:
+        config_path = os.getenv("A2E_CONFIG_PATH", "/app/config/avatars/pro_plan_optimized.json")
+        async with A2EClient(config_path=config_path) as client:
+            return await check_balance(client=client)
+    
+    credits = await client.get_credits()
+    usage = client.credit_manager.get_usage_report()
+    
+    return {
+        "plan": credits.plan_type.value,
+        "total_credits": credits.total_credits,
+        "remaining_credits": credits.remaining_credits,
+        "usage_percentage": round(credits.usage_percentage, 2),
+        "daily_usage": usage["daily"],
+        "monthly_usage": usage["monthly"]
+    }
 
 
 # Export main classes and functions
@@ -3,13 +3,91 @@ import json
 import asyncio
 import logging
 from decimal import Decimal
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    # Opcional: se usa el módulo json estándar
+    orjson = None
+
 # Configuración de logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Phase2Generator")
 
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path_str: str, mtime: float) -> Any:
+    """
+    Parsea un JSON una sola vez por (ruta, mtime); todas las instancias
+    comparten el resultado, así que debe tratarse como de solo lectura.
+    """
+    raw = Path(path_str).read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _load_config_section(path: Path, key: str, default: Any) -> Any:
+    """Devuelve config[key] del JSON en path, o default si el archivo no existe."""
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return default
+    return _load_json_cached(str(path), mtime)[key]
+
+
+def _loras_for_level(nsfw_level: int) -> tuple:
+    """Combinación de LoRAs (nombre, peso) para un nivel NSFW."""
+    selected_loras = []
+    
+    # 1. Base Glamour (Dependiente del nivel)
+    if nsfw_level >= 4:
+        selected_loras.append(("glamour_elegant_v1", 0.8))
+    
+    # 2. Expresiones (Dependiente del nivel)
+    if nsfw_level >= 6:
+        selected_loras.append(("expressions_passionate_v1", 0.7))
+    elif nsfw_level >= 2:
+        selected_loras.append(("expressions_intimate_v1", 0.65))
+        
+    # 3. Ropa/Lencería
+    if nsfw_level >= 6:
+        selected_loras.append(("clothing_lingerie_bold_v1", 0.75))
+    elif nsfw_level >= 4:
+        selected_loras.append(("clothing_lingerie_elegant_v1", 0.75))
+
+    # 4. Poses
+    if nsfw_level >= 4:
+        selected_loras.append(("poses_boudoir_v1", 0.75))
+
+    return tuple(selected_loras)
+
+
+def _prompt_parts_for_level(nsfw_level: int) -> tuple:
+    """Fragmentos de prompt propios de un nivel NSFW."""
+    if nsfw_level == 2:
+        return ("suggestive expression", "lingerie", "soft lighting", "intimate atmosphere")
+    elif nsfw_level == 4:
+        return ("intimate expression", "silk lingerie", "boudoir setting", "sensual reclining")
+    elif nsfw_level == 6:
+        return ("passionate expression", "bold lingerie", "chiaroscuro lighting", "dramatic shadows")
+    elif nsfw_level >= 8:
+        return ("ecstasy expression", "artistic nudity", "premium production", "4k detail")
+    return ()
+
+
+# Tablas precalculadas por nivel (0-10); niveles fuera de rango se recortan
+# (por debajo de 0 equivale a 0 y por encima de 10 a 10)
+_MAX_NSFW_LEVEL = 10
+_LORAS_BY_LEVEL = tuple(_loras_for_level(level) for level in range(_MAX_NSFW_LEVEL + 1))
+_PROMPT_PARTS_BY_LEVEL = tuple(_prompt_parts_for_level(level) for level in range(_MAX_NSFW_LEVEL + 1))
+_PROMPT_SUFFIX = ("high quality", "8k uhd", "professional photography")
+
+
+def _level_index(nsfw_level: int) -> int:
+    return min(max(nsfw_level, 0), _MAX_NSFW_LEVEL)
+
 class Phase2ContentGenerator:
     """
     Automatiza la generación de contenido de Fase 2 (Adulto) usando la API de A2E.
@@ -31,30 +109,20 @@ class Phase2ContentGenerator:
 
     def _load_configs(self):
         """Carga todas las configuraciones necesarias para la generación."""
+        # Parseo cacheado por (ruta, mtime): nuevas instancias no releen disco
+        project_root = Path(os.getenv("PROJECT_ROOT", "/app"))
         try:
             # Configuración de personajes
-            char_path = Path(os.getenv("PROJECT_ROOT", "/app")) / "config/avatars/elite8_characters.json"
-            if char_path.exists():
-                with open(char_path, "r", encoding="utf-8") as f:
-                    self.characters = json.load(f)["characters"]
-            else:
-                self.characters = {}
+            self.characters = _load_config_section(
+                project_root / "config/avatars/elite8_characters.json", "characters", {})
 
             # Escalada NSFW
-            esc_path = Path(os.getenv("PROJECT_ROOT", "/app")) / "config/funnels/nsfw_escalation.json"
-            if esc_path.exists():
-                with open(esc_path, "r", encoding="utf-8") as f:
-                    self.escalation = json.load(f)["escalation_levels"]
-            else:
-                self.escalation = []
+            self.escalation = _load_config_section(
+                project_root / "config/funnels/nsfw_escalation.json", "escalation_levels", [])
 
             # Registro de LoRAs Phase 2
-            lora_path = Path(os.getenv("PROJECT_ROOT", "/app")) / "config/phase2_lora_models.json"
-            if lora_path.exists():
-                with open(lora_path, "r", encoding="utf-8") as f:
-                    self.loras = json.load(f)["lora_registry"]
-            else:
-                self.loras = {}
+            self.loras = _load_config_section(
+                project_root / "config/phase2_lora_models.json", "lora_registry", {})
 
         except Exception as e:
             logger.error(f"Error cargando configuraciones: {e}")
@@ -63,29 +131,9 @@ class Phase2ContentGenerator:
         """
         Obtiene la combinación optimizada de LoRAs para un personaje y nivel NSFW.
         """
-        selected_loras = []
-        
-        # 1. Base Glamour (Dependiente del nivel)
-        if nsfw_level >= 4:
-            selected_loras.append({"name": "glamour_elegant_v1", "weight": 0.8})
-        
-        # 2. Expresiones (Dependiente del nivel)
-        if nsfw_level >= 6:
-            selected_loras.append({"name": "expressions_passionate_v1", "weight": 0.7})
-        elif nsfw_level >= 2:
-            selected_loras.append({"name": "expressions_intimate_v1", "weight": 0.65})
-            
-        # 3. Ropa/Lencería
-        if nsfw_level >= 6:
-            selected_loras.append({"name": "clothing_lingerie_bold_v1", "weight": 0.75})
-        elif nsfw_level >= 4:
-            selected_loras.append({"name": "clothing_lingerie_elegant_v1", "weight": 0.75})
-
-        # 4. Poses
-        if nsfw_level >= 4:
-            selected_loras.append({"name": "poses_boudoir_v1", "weight": 0.75})
-
-        return selected_loras
+        # Dicts nuevos en cada llamada: el llamador puede modificarlos/serializarlos
+        return [{"name": name, "weight": weight}
+                for name, weight in _LORAS_BY_LEVEL[_level_index(nsfw_level)]]
 
     def construct_prompt(self, character_id: str, nsfw_level: int, context: str = "") -> str:
         """
@@ -95,23 +143,9 @@ class Phase2ContentGenerator:
         char_data = self.characters.get(character_id, {})
         trigger = char_data.get("trigger_word", f"{character_id}_v1")
         
-        prompt_parts = [trigger]
-        
-        if nsfw_level == 2:
-            prompt_parts += ["suggestive expression", "lingerie", "soft lighting", "intimate atmosphere"]
-        elif nsfw_level == 4:
-            prompt_parts += ["intimate expression", "silk lingerie", "boudoir setting", "sensual reclining"]
-        elif nsfw_level == 6:
-            prompt_parts += ["passionate expression", "bold lingerie", "chiaroscuro lighting", "dramatic shadows"]
-        elif nsfw_level >= 8:
-            prompt_parts += ["ecstasy expression", "artistic nudity", "premium production", "4k detail"]
-            
-        if context:
-            prompt_parts.append(context)
-            
-        prompt_parts += ["high quality", "8k uhd", "professional photography"]
-        
-        return ", ".join(prompt_parts)
+        context_parts = (context,) if context else ()
+        return ", ".join((trigger, *_PROMPT_PARTS_BY_LEVEL[_level_index(nsfw_level)],
+                          *context_parts, *_PROMPT_SUFFIX))
 
     async def generate_reference_set(self, character_id: str, levels: List[int] = [2, 4, 6]):
         """
@@ -142,8 +176,13 @@ class Phase2ContentGenerator:
             
         # Guardar manifiesto de generación
         manifest_path = self.output_root / f"{character_id}_reference_manifest.json"
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2)
+        if orjson:
+            # orjson escribe bytes UTF-8 directamente, sin pasar por str
+            with open(manifest_path, "wb") as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
             
         logger.info(f"Manifiesto guardado en: {manifest_path}")
         return results
@@ -6,9 +6,12 @@ Provides high-quality voice generation using Piper TTS
 import asyncio
 import subprocess
 import os
+import time
+import json
+import wave
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +21,92 @@ class PiperTTSClient:
     Generates natural-sounding voice audio from text
     """
     
+    # Seconds to skip the Wyoming path after the server could not be reached
+    WYOMING_RETRY_COOLDOWN = 60
+    
     def __init__(self, piper_host: str = "piper", piper_port: int = 10200):
         self.piper_host = piper_host
         self.piper_port = piper_port
         self.voices_dir = Path("/voices")
         
+        # Persistent Wyoming connection to the Piper server (keeps the voice
+        # model warm); the protocol carries one synthesis at a time
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+        # time.monotonic() before which the server is assumed unreachable
+        self._wyoming_retry_after = 0.0
+        
+        # Long-lived `piper --json-input` processes for the docker exec
+        # fallback, one per (voice, speed); each loads its model only once
+        self._processes: Dict[Tuple[str, float], asyncio.subprocess.Process] = {}
+        self._process_lock = asyncio.Lock()
+    
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open (or reuse) the TCP connection to the Piper server"""
+        if self._writer is None or self._writer.is_closing():
+            # asyncio sets TCP_NODELAY on TCP streams, so the short JSON
+            # event lines are sent immediately (no Nagle delay)
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.piper_host, self.piper_port),
+                timeout=5
+            )
+        return self._reader, self._writer
+    
+    async def _close_connection(self):
+        """Drop the cached connection (it is reopened on next use)"""
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+    
+    @staticmethod
+    async def _read_event(reader: asyncio.StreamReader) -> Tuple[str, dict, bytes]:
+        """Read one Wyoming event: JSON header line, optional data and payload"""
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("Piper server closed the connection")
+        header = json.loads(line)
+        data = header.get("data") or {}
+        if header.get("data_length"):
+            data.update(json.loads(await reader.readexactly(header["data_length"])))
+        payload = b""
+        if header.get("payload_length"):
+            payload = await reader.readexactly(header["payload_length"])
+        return header["type"], data, payload
+    
+    async def _synthesize_wyoming(self, text: str, voice: str, output_path: str):
+        """Synthesize over the Wyoming protocol and write the audio as WAV"""
+        reader, writer = await self._connect()
+        event = {"type": "synthesize", "data": {"text": text, "voice": {"name": voice}}}
+        writer.write(json.dumps(event).encode("utf-8") + b"\n")
+        await writer.drain()
+        
+        wav = None
+        try:
+            while True:
+                event_type, data, payload = await self._read_event(reader)
+                if event_type == "error":
+                    raise RuntimeError(data.get("text", "Piper server error"))
+                if event_type in ("audio-start", "audio-chunk") and wav is None:
+                    wav = wave.open(output_path, "wb")
+                    wav.setframerate(data.get("rate", 22050))
+                    wav.setsampwidth(data.get("width", 2))
+                    wav.setnchannels(data.get("channels", 1))
+                if event_type == "audio-chunk":
+                    wav.writeframes(payload)
+                elif event_type == "audio-stop":
+                    break
+        finally:
+            if wav is not None:
+                wav.close()
+        
+        if wav is None:
+            raise RuntimeError("Piper server returned no audio")
+        
     async def generate_speech(
         self,
         text: str,
@@ -42,39 +126,106 @@ class PiperTTSClient:
         Returns:
             Path to generated audio file, or None if failed
         """
-        try:
-            # Prepare command
+        # The Wyoming server has no per-request speed; other speeds use the CLI.
+        # After a failed connect the CLI is used until the cooldown expires
+        if speed == 1.0 and time.monotonic() >= self._wyoming_retry_after:
+            async with self._lock:
+                for attempt in (1, 2):
+                    reused = self._writer is not None and not self._writer.is_closing()
+                    try:
+                        await asyncio.wait_for(
+                            self._synthesize_wyoming(text, voice, output_path),
+                            timeout=60
+                        )
+                        logger.info(f"Generated speech for: {text[:50]}... -> {output_path}")
+                        return output_path
+                    except Exception as e:
+                        await self._close_connection()
+                        # A reused connection may simply have been closed by
+                        # the server; retry once on a fresh one
+                        if reused and attempt == 1:
+                            continue
+                        if isinstance(e, RuntimeError):
+                            # The server answered with an error for this request
+                            logger.warning(f"Piper server failed ({e}), falling back to docker exec")
+                        else:
+                            self._wyoming_retry_after = time.monotonic() + self.WYOMING_RETRY_COOLDOWN
+                            logger.warning(
+                                f"Piper server unavailable ({e}), using docker exec "
+                                f"for the next {self.WYOMING_RETRY_COOLDOWN}s"
+                            )
+                        break
+        
+        return await self._generate_speech_exec(text, voice, output_path, speed)
+    
+    async def _get_process(self, voice: str, speed: float) -> asyncio.subprocess.Process:
+        """Return the running piper process for this voice/speed, spawning it if needed"""
+        process = self._processes.get((voice, speed))
+        if process is None or process.returncode is not None:
             cmd = [
                 "docker", "exec", "-i", "waifugen_piper",
                 "piper",
                 "--model", voice,
-                "--output_file", output_path,
+                "--json-input",
             ]
             
             if speed != 1.0:
                 cmd.extend(["--length_scale", str(1.0 / speed)])
             
-            # Run Piper TTS
+            # stderr is discarded: nobody drains it for a long-lived process
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.DEVNULL
             )
-            
-            # Send text via stdin
-            stdout, stderr = await process.communicate(input=text.encode('utf-8'))
-            
-            if process.returncode == 0:
-                logger.info(f"Generated speech for: {text[:50]}... -> {output_path}")
-                return output_path
-            else:
-                logger.error(f"Piper TTS failed: {stderr.decode()}")
-                return None
+            self._processes[(voice, speed)] = process
+        return process
+    
+    async def _kill_process(self, voice: str, speed: float):
+        """Terminate and forget the piper process for this voice/speed"""
+        process = self._processes.pop((voice, speed), None)
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+    
+    async def _generate_speech_exec(
+        self,
+        text: str,
+        voice: str,
+        output_path: str,
+        speed: float
+    ) -> Optional[str]:
+        """Fallback: feed the piper CLI inside its container via docker exec"""
+        # One JSON line per utterance; piper prints the output path when done
+        request = json.dumps({"text": text, "output_file": output_path}).encode("utf-8") + b"\n"
+        
+        async with self._process_lock:
+            try:
+                process = await self._get_process(voice, speed)
+                process.stdin.write(request)
+                await process.stdin.drain()
+                line = await asyncio.wait_for(process.stdout.readline(), timeout=60)
                 
-        except Exception as e:
-            logger.error(f"Error generating speech: {e}")
-            return None
+                if line:
+                    logger.info(f"Generated speech for: {text[:50]}... -> {output_path}")
+                    return output_path
+                else:
+                    logger.error(f"Piper TTS process exited (code {process.returncode})")
+                    await self._kill_process(voice, speed)
+                    return None
+                    
+            except Exception as e:
+                # The pipe may be out of step after a timeout; start afresh next time
+                await self._kill_process(voice, speed)
+                logger.error(f"Error generating speech: {e}")
+                return None
+    
+    async def close(self):
+        """Close the Piper server connection and any piper processes"""
+        await self._close_connection()
+        for voice, speed in list(self._processes):
+            await self._kill_process(voice, speed)
     
     def list_available_voices(self) -> list:
         """
@@ -128,5 +279,7 @@ if __name__ == "__main__":
         
         if result:
             print(f"Audio generated: {result}")
+        
+        await client.close()
     
     asyncio.run(main())
@@ -1,8 +1,10 @@
 from fastapi import FastAPI, HTTPException, Header, Depends
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, List
 import os
 import logging
+import time
 import uuid
 from datetime import datetime
 
@@ -13,7 +15,18 @@ except ImportError:
     # Fallback si no está instalado aún en el sistema de archivos
     vault = None
 
-app = FastAPI(title="WaifuGen Shim API", version="1.0.0")
+try:
+    import orjson
+except ImportError:
+    # Opcional: sin orjson se usa la respuesta JSON estándar de FastAPI
+    orjson = None
+
+# orjson serializa directamente a bytes (y datetime de forma nativa)
+app = FastAPI(
+    title="WaifuGen Shim API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse if orjson else JSONResponse
+)
 logger = logging.getLogger("ShimAPI")
 
 # Models
@@ -34,9 +47,23 @@ def verify_api_key(x_api_key: str = Header(...)):
         raise HTTPException(status_code=403, detail="Invalid API Key")
     return x_api_key
 
+# Marca de tiempo ISO cacheada con resolución de 1 s: /health la sondean los
+# balanceadores continuamente y formatear datetime en cada llamada es caro
+_ts_second = 0
+_ts_iso = ""
+
+def _cached_timestamp() -> str:
+    global _ts_second, _ts_iso
+    second = int(time.time())
+    if second != _ts_second:
+        _ts_iso = datetime.fromtimestamp(second).isoformat()
+        _ts_second = second
+    return _ts_iso
+
+# async: sin trabajo bloqueante, así no pasa por el threadpool de FastAPI
 @app.get("/health")
-def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+async def health_check():
+    return {"status": "healthy", "timestamp": _cached_timestamp()}
 
 # 6 Flows de Phase 1
 @app.post("/api/generate/talking_avatar", response_model=APIResponse)
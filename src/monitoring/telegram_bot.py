@@ -249,13 +249,22 @@ class TelegramBot:
         while self.running:
             try:
                 notification = await self.notification_queue.get()
-                await self._send_notification(notification)
+                try:
+                    await self._send_notification(notification)
+                finally:
+                    self.notification_queue.task_done()
                 await asyncio.sleep(0.1)  # Rate limiting
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error processing notification: {e}")
     
+    async def flush(self):
+        """Wait until every queued notification has been sent"""
+        if not self.running:
+            return
+        await self.notification_queue.join()
+    
     async def _send_notification(self, notification: Dict[str, Any]):
         """Send a notification to all configured chats"""
         notification_type = notification.get('type')
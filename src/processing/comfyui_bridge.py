@@ -9,7 +9,7 @@ from pathlib import Path
 from datetime import datetime
 
 # Import GpuRentalManager
-from processing.gpu_rental_manager import GpuRentalManager, GpuRentalProvider
+from src.processing.gpu_rental_manager import GpuRentalManager, GpuRentalProvider
 
 logger = logging.getLogger("ComfyUI_Bridge")
 
@@ -4,13 +4,9 @@ import sys
 import json
 import asyncio
 import logging
-from pathlib import Path
 
-# Add project root to sys.path
-PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT", "/app"))
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
-
-from processing.gpu_rental_manager import GpuRentalManager, GpuInstance, GpuRentalProvider
+# Requires the project installed (pip install -e .)
+from src.processing.gpu_rental_manager import GpuRentalManager, GpuInstance, GpuRentalProvider
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
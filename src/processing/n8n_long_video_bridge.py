@@ -1,16 +1,18 @@
 
 import os
-import sys
 import json
 import asyncio
+import argparse
 import logging
-from pathlib import Path
 
-# Add project root to sys.path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
+# Requires the project installed (pip install -e .)
+from src.processing.comfyui_bridge import ComfyUIBridge
 
-from processing.comfyui_bridge import ComfyUIBridge
+try:
+    import orjson
+except ImportError:
+    # Optional: falls back to the stdlib json module
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -29,8 +31,7 @@ async def run_gpu_production(request_data):
 
     if not config["runpod_api_key"]:
         logger.error("❌ RUNPOD_API_KEY not found in environment")
-        print(json.dumps({"status": "error", "message": "RUNPOD_API_KEY missing"}))
-        return
+        return {"status": "error", "message": "RUNPOD_API_KEY missing"}
 
     bridge = ComfyUIBridge(config)
     
@@ -46,19 +47,47 @@ async def run_gpu_production(request_data):
     logger.info(f"🚀 Dispatching to ComfyUI on RunPod: {character_data['name']}")
     
     try:
-        result = await bridge.generate(character_data, prompt, workflow)
-        print(json.dumps(result))
+        return await bridge.generate(character_data, prompt, workflow)
     except Exception as e:
         logger.error(f"❌ Bridge execution failed: {e}")
-        print(json.dumps({"status": "error", "message": str(e)}))
+        return {"status": "error", "message": str(e)}
+
+
+def run(request_data: dict) -> dict:
+    """
+    Synchronous entry point for in-process callers (tests, other scripts).
+    Avoids spawning a new interpreter and re-serializing the payload.
+    """
+    return asyncio.run(run_gpu_production(request_data))
+
+
+def _emit(result: dict, out_fd: int = None):
+    """
+    Write the JSON result for the parent process.
+    With --out-fd the result goes to that inherited descriptor, leaving
+    stdout free for logs; otherwise it is printed to stdout.
+    """
+    payload = orjson.dumps(result) if orjson else json.dumps(result).encode("utf-8")
+    if out_fd is None:
+        print(payload.decode("utf-8"))
+        return
+    with os.fdopen(out_fd, "wb") as out:
+        out.write(payload)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
+    parser = argparse.ArgumentParser(description="n8n -> GPU production bridge")
+    parser.add_argument("payload", nargs="?", help="Request JSON")
+    parser.add_argument("--out-fd", type=int, default=None,
+                        help="File descriptor (passed via pass_fds) for the JSON result")
+    args = parser.parse_args()
+
+    if args.payload:
         try:
-            data = json.loads(sys.argv[1])
-            asyncio.run(run_gpu_production(data))
+            data = orjson.loads(args.payload) if orjson else json.loads(args.payload)
         except Exception as e:
-            print(json.dumps({"status": "error", "message": f"Invalid JSON input: {e}"}))
+            _emit({"status": "error", "message": f"Invalid JSON input: {e}"}, args.out_fd)
+        else:
+            _emit(run(data), args.out_fd)
     else:
-        print(json.dumps({"status": "error", "message": "No input data provided"}))
+        _emit({"status": "error", "message": "No input data provided"}, args.out_fd)
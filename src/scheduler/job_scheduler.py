@@ -14,7 +14,8 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Callable
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 from enum import Enum
@@ -38,6 +39,21 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Platform-specific optimal posting times (Asia/Tokyo)
+OPTIMAL_POSTING_TIMES = {
+    "tiktok": ("08:00", "12:00", "18:00", "21:00"),
+    "instagram": ("08:00", "12:00", "18:00", "21:00"),
+    "youtube": ("08:00", "12:00", "18:00", "21:00")
+}
+
+
+@lru_cache(maxsize=64)
+def _parse_posting_times(platform: str) -> Tuple[Tuple[int, int], ...]:
+    """Parse a platform's optimal "HH:MM" times into (hour, minute) pairs once"""
+    times = OPTIMAL_POSTING_TIMES.get(platform, ("12:00",))
+    return tuple(tuple(map(int, time_str.split(":"))) for time_str in times)
+
+
 class ScheduleType(Enum):
     """Types of scheduled tasks"""
     VIDEO_GENERATION = "video_generation"
@@ -678,19 +694,11 @@ class ContentScheduler:
         if day_of_week is None:
             day_of_week = now.weekday()
         
-        # Platform-specific optimal times
-        optimal_times = {
-            "tiktok": ["08:00", "12:00", "18:00", "21:00"],
-            "instagram": ["08:00", "12:00", "18:00", "21:00"],
-            "youtube": ["08:00", "12:00", "18:00", "21:00"]
-        }
-        
-        times = optimal_times.get(platform, ["12:00"])
         result = []
         
-        for time_str in times:
-            hour, minute = map(int, time_str.split(":"))
-            
+        # The parsed time table is cached; the times themselves depend on
+        # "now" (past slots roll over), so they are computed per call
+        for hour, minute in _parse_posting_times(platform):
             posting_time = now.replace(
                 hour=hour, minute=minute, second=0, microsecond=0
             )